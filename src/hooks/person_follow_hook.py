@@ -1,18 +1,81 @@
 import asyncio
 import logging
-from typing import Any, Dict
+import random
+import time
+from typing import Any, Dict, Optional
 
 import aiohttp
 
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
 
 PERSON_FOLLOW_BASE_URL = "http://localhost:8080"
+STATUS_POLL_INTERVAL = 0.5
+
+_tts_provider: Optional[ElevenLabsTTSProvider] = None
+_session: Optional[aiohttp.ClientSession] = None
+
+# Attempts the last successful enrollment needed; None means no recent success
+_healthy_retries: Optional[int] = None
+
+
+def _get_tts_provider() -> ElevenLabsTTSProvider:
+    """
+    Return the TTS provider shared by all hook invocations.
+
+    The provider is created on first use and cached at module scope. No lock
+    is needed: the check and assignment run without yielding to the event loop.
+
+    Returns
+    -------
+    ElevenLabsTTSProvider
+        The cached TTS provider instance.
+    """
+    global _tts_provider
+    if _tts_provider is None:
+        _tts_provider = ElevenLabsTTSProvider()
+    return _tts_provider
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the HTTP session shared by the person follow hooks.
+
+    The session and its connection pool are created on first use and reused
+    across hook invocations and retry attempts, so keep-alive connections to
+    the person-following service are not re-established on every request.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        The shared HTTP session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, ttl_dns_cache=300, keepalive_timeout=60
+            )
+        )
+    return _session
 
 
 async def start_person_follow_hook(context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Hook to start person following mode by enrolling a person to track.
 
+    After each enroll request the /status endpoint is queried with a
+    ``wait`` parameter holding the seconds left in the attempt. A server
+    that supports long polling keeps the request open until ``is_tracked``
+    becomes true or ``wait`` runs out, so one request covers the attempt.
+    A server that ignores the parameter answers immediately and the status
+    is polled every STATUS_POLL_INTERVAL seconds instead.
+
+    Failed attempts are retried with exponential backoff and jitter. An
+    enroll rejected with a 4xx status is not retried. After a successful
+    enrollment the next call allows only two attempts more than that one
+    needed (capped at ``max_retries``); the full budget is restored as soon
+    as a call fails.
+
     Parameters
     ----------
     context : Dict[str, Any]
@@ -21,70 +84,102 @@ async def start_person_follow_hook(context: Dict[str, Any]) -> Dict[str, Any]:
     base_url = context.get("person_follow_base_url", PERSON_FOLLOW_BASE_URL)
     enroll_timeout = context.get("enroll_timeout", 3.0)
     max_retries = context.get("max_retries", 5)
+    base_delay = context.get("base_delay", 1.0)
+    max_delay = context.get("max_delay", 30.0)
+    jitter = context.get("jitter", 0.5)
 
-    elevenlabs_provider = ElevenLabsTTSProvider()
+    global _healthy_retries
+    if _healthy_retries is not None:
+        max_retries = min(max_retries, _healthy_retries + 2)
+
+    elevenlabs_provider = _get_tts_provider()
     enroll_url = f"{base_url}/enroll"
     status_url = f"{base_url}/status"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(max_retries):
-                logging.info(
-                    f"Person Follow: Enrolling (attempt {attempt + 1}/{max_retries})"
+        session = _get_session()
+        for attempt in range(max_retries):
+            if attempt > 0:
+                delay = min(
+                    max_delay,
+                    base_delay * (2 ** (attempt - 1)) * (1 + random.uniform(0, jitter)),
                 )
+                if delay > 0:
+                    await asyncio.sleep(delay)
 
-                try:
-                    async with session.post(
-                        enroll_url,
-                        timeout=aiohttp.ClientTimeout(total=5),
-                    ) as response:
-                        if response.status != 200:
-                            continue
-                        logging.info("Person Follow: Enroll command sent")
-                except aiohttp.ClientError as e:
-                    logging.warning(f"Person Follow: Enroll failed: {e}")
-                    continue
-
-                elapsed = 0.0
-                while elapsed < enroll_timeout:
-                    await asyncio.sleep(0.5)
-                    elapsed += 0.5
-
-                    try:
-                        async with session.get(
-                            status_url,
-                            timeout=aiohttp.ClientTimeout(total=2),
-                        ) as status_response:
-                            if status_response.status == 200:
-                                status_data = await status_response.json()
-                                if status_data.get("is_tracked", False):
-                                    logging.info("Person Follow: Tracking started")
-                                    elevenlabs_provider.add_pending_message(
-                                        "I see you! I'll follow you now."
-                                    )
-                                    return {
-                                        "status": "success",
-                                        "message": "Person enrolled and tracking",
-                                        "is_tracked": True,
-                                    }
-                    except Exception as e:
-                        logging.warning(f"Person Follow: Status poll failed: {e}")
-
-                logging.info(
-                    f"Person Follow: Attempt {attempt + 1} - not tracking, retrying"
-                )
+            logging.info(
+                f"Person Follow: Enrolling (attempt {attempt + 1}/{max_retries})"
+            )
 
-            logging.info("Person Follow: Awaiting person detection")
-            elevenlabs_provider.add_pending_message(
-                "Person following mode activated. Please stand in front of me."
+            try:
+                async with session.post(
+                    enroll_url,
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as response:
+                    if 400 <= response.status < 500:
+                        logging.error(
+                            f"Person Follow: Enroll rejected with status {response.status}"
+                        )
+                        _healthy_retries = None
+                        return {
+                            "status": "error",
+                            "message": f"Enroll rejected with status {response.status}",
+                        }
+                    if response.status != 200:
+                        continue
+                    logging.info("Person Follow: Enroll command sent")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.warning(f"Person Follow: Enroll failed: {e}")
+                continue
+
+            elapsed = 0.0
+            while elapsed < enroll_timeout:
+                await asyncio.sleep(STATUS_POLL_INTERVAL)
+                elapsed += STATUS_POLL_INTERVAL
+
+                wait = max(enroll_timeout - elapsed, 0.0)
+                poll_start = time.monotonic()
+                try:
+                    async with session.get(
+                        status_url,
+                        params={"wait": wait},
+                        timeout=aiohttp.ClientTimeout(total=wait + 2),
+                    ) as status_response:
+                        if status_response.status == 200:
+                            status_data = await status_response.json()
+                            if status_data.get("is_tracked", False):
+                                logging.info("Person Follow: Tracking started")
+                                _healthy_retries = attempt + 1
+                                elevenlabs_provider.add_pending_message(
+                                    "I see you! I'll follow you now."
+                                )
+                                return {
+                                    "status": "success",
+                                    "message": "Person enrolled and tracking",
+                                    "is_tracked": True,
+                                }
+                except Exception as e:
+                    logging.warning(f"Person Follow: Status poll failed: {e}")
+
+                elapsed += time.monotonic() - poll_start
+
+            logging.info(
+                f"Person Follow: Attempt {attempt + 1} - not tracking, retrying"
             )
-            return {
-                "status": "success",
-                "message": "Enrolled but awaiting person detection",
-                "is_tracked": False,
-            }
+
+        _healthy_retries = None
+        logging.info("Person Follow: Awaiting person detection")
+        elevenlabs_provider.add_pending_message(
+            "Person following mode activated. Please stand in front of me."
+        )
+        return {
+            "status": "success",
+            "message": "Enrolled but awaiting person detection",
+            "is_tracked": False,
+        }
 
     except aiohttp.ClientError as e:
+        _healthy_retries = None
         logging.error(f"Person Follow: Connection error: {str(e)}")
         elevenlabs_provider.add_pending_message(
             "I couldn't connect to the person following system."
@@ -105,20 +200,36 @@ async def stop_person_follow_hook(context: Dict[str, Any]) -> Dict[str, Any]:
     clear_url = f"{base_url}/clear"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            logging.info(f"Person Follow: Calling clear at {clear_url}")
-
-            async with session.post(
-                clear_url,
-                timeout=aiohttp.ClientTimeout(total=5),
-            ) as response:
-                if response.status == 200:
-                    logging.info("Person Follow: Cleared successfully")
-                    return {"status": "success", "message": "Person tracking stopped"}
-                else:
-                    logging.error("Person Follow: Failed to clear")
-                    return {"status": "error", "message": "Clear failed"}
+        session = _get_session()
+        logging.info(f"Person Follow: Calling clear at {clear_url}")
+
+        async with session.post(
+            clear_url,
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
+            if response.status == 200:
+                logging.info("Person Follow: Cleared successfully")
+                return {"status": "success", "message": "Person tracking stopped"}
+            else:
+                logging.error("Person Follow: Failed to clear")
+                return {"status": "error", "message": "Clear failed"}
 
     except aiohttp.ClientError as e:
         logging.error(f"Person Follow: Clear error: {str(e)}")
         return {"status": "error", "message": f"Connection error: {str(e)}"}
+
+
+async def close_person_follow_session(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Hook to close the HTTP session shared by the person follow hooks.
+
+    Parameters
+    ----------
+    context : Dict[str, Any]
+        Context dictionary containing configuration parameters.
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    return {"status": "success", "message": "Person follow session closed"}
@@ -1,9 +1,11 @@
 import asyncio
 import logging
 import time
-from typing import Optional
+from collections import deque
+from typing import AsyncIterator, Deque, Optional
 
 import aiohttp
+from pydantic import Field
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
@@ -15,8 +17,31 @@ from providers.io_provider import IOProvider
 # Note: Etherscan.io does not handle bytes[]/json well. See below for ways to
 # interact with HOLESKY and decode the data, generating an ASCII string.
 
+# ABI layout of the getRuleSet() bytes[] response: array offset, array length
+# and element offset words precede the 32-byte string length word.
+_STRING_LENGTH_START = 96
+_STRING_DATA_START = 128
 
-class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
+
+class GovernanceEthereumConfig(SensorConfig):
+    """
+    Configuration for Ethereum Governance Sensor.
+
+    Parameters
+    ----------
+    rules_ttl : float
+        Seconds a successfully loaded rule set is reused before the
+        blockchain is queried again.
+    """
+
+    rules_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds a loaded rule set is reused before querying the blockchain again",
+    )
+
+
+class GovernanceEthereum(FuserInput[GovernanceEthereumConfig, Optional[str]]):
     """
     Ethereum ERC-7777 reader that tracks governance rules.
 
@@ -32,11 +57,22 @@ class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
         """
         Load governance rules from the Ethereum blockchain.
 
+        Successful results are cached for ``rules_ttl`` seconds (60 by
+        default) to avoid repeating the RPC call on every poll.
+
         Returns
         -------
         Optional[str]
             Decoded governance rules string, or None on error.
         """
+        # Rules change at most every few blocks, so serve recent results from
+        # memory instead of issuing an RPC call on every poll.
+        if (
+            self._rules_cache is not None
+            and time.monotonic() - self._rules_cache_ts < self._rules_ttl
+        ):
+            return self._rules_cache
+
         logging.info("Loading rules from Ethereum blockchain")
 
         payload = {
@@ -54,37 +90,74 @@ class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.rpc_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    logging.debug(f"Blockchain response status: {response.status}")
-
-                    if response.status == 200:
-                        result = await response.json()
-                        if "result" in result and result["result"]:
-                            hex_response = result["result"]
-                            logging.debug(f"Raw blockchain response: {hex_response}")
-
-                            decoded_data = self.decode_eth_response(hex_response)
-                            logging.debug(f"Decoded blockchain data: {decoded_data}")
-                            return decoded_data
-                        else:
-                            logging.error(
-                                "Error: No valid result in blockchain response"
-                            )
+            session = self._get_session()
+            async with session.post(
+                self.rpc_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                logging.debug(f"Blockchain response status: {response.status}")
+
+                if response.status == 200:
+                    result = await response.json()
+                    if "result" in result and result["result"]:
+                        hex_response = result["result"]
+                        logging.debug(f"Raw blockchain response: {hex_response}")
+
+                        decoded_data = self.decode_eth_response(hex_response)
+                        logging.debug(f"Decoded blockchain data: {decoded_data}")
+                        if decoded_data is not None:
+                            self._rules_cache = decoded_data
+                            self._rules_cache_ts = time.monotonic()
+                        return decoded_data
                     else:
-                        logging.error(
-                            f"Error: Blockchain request failed with status {response.status}"
-                        )
+                        logging.error("Error: No valid result in blockchain response")
+                else:
+                    logging.error(
+                        f"Error: Blockchain request failed with status {response.status}"
+                    )
         except Exception as e:
             logging.error(f"Error loading rules from blockchain: {e}")
 
         return None
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Session reused across polls so the RPC connection stays alive.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _listen_loop(self) -> AsyncIterator[Optional[str]]:
+        """
+        Poll continuously and release the HTTP session when the loop ends.
+
+        Yields
+        ------
+        Optional[str]
+            Governance rules from polling.
+        """
+        try:
+            while True:
+                yield await self._poll()
+        finally:
+            await asyncio.shield(self.close())
+
     def decode_eth_response(self, hex_response: str) -> Optional[str]:
         """
         Decodes an Ethereum eth_call response.
@@ -99,36 +172,38 @@ class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
         Optional[str]
             Decoded string, or None on error.
         """
-        if hex_response.startswith("0x"):
-            hex_response = hex_response[2:]
-
         try:
-            response_bytes = bytes.fromhex(hex_response)
+            response_bytes = bytes.fromhex(hex_response.removeprefix("0x"))
 
             # Read offsets and string length
             # offset = int.from_bytes(response_bytes[:32], "big")
-            string_length = int.from_bytes(response_bytes[96:128], "big")
+            string_length = int.from_bytes(
+                response_bytes[_STRING_LENGTH_START:_STRING_DATA_START], "big"
+            )
 
             # Extract and decode string
-            string_bytes = response_bytes[128 : 128 + string_length]
+            string_bytes = response_bytes[
+                _STRING_DATA_START : _STRING_DATA_START + string_length
+            ]
             decoded_string = string_bytes.decode("utf-8")
 
-            # Remove unexpected control characters (like \x19)
-            cleaned_string = "".join(ch for ch in decoded_string if ch.isprintable())
-
-            return cleaned_string
+            # Most rule sets are already clean; only filter per character
+            # when there are unexpected control characters (like \x19)
+            if decoded_string.isprintable():
+                return decoded_string
+            return "".join(ch for ch in decoded_string if ch.isprintable())
 
         except Exception as e:
             logging.error(f"Decoding error: {e}")
             return None
 
-    def __init__(self, config: SensorConfig):
+    def __init__(self, config: GovernanceEthereumConfig):
         """
         Initialize GovernanceEthereum instance.
 
         Parameters
         ----------
-        config : SensorConfig
+        config : GovernanceEthereumConfig
             Configuration settings for the sensor input.
         """
         super().__init__(config)
@@ -150,7 +225,16 @@ class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
         # It's currently = 2
         self.function_argument = "0000000000000000000000000000000000000000000000000000000000000002"  # Argument
         self.universal_rule: Optional[str] = None
-        self.messages: list[Message] = []
+        # Bounded history; rules change rarely and only the latest is read
+        self.messages: Deque[Message] = deque(maxlen=1024)
+        self._last_message: Optional[str] = None
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Cache of the last successfully decoded rule set
+        self._rules_cache: Optional[str] = None
+        self._rules_cache_ts = 0.0
+        self._rules_ttl = self.config.rules_ttl
 
         logging.info(
             "GovernanceEthereum initialized, rules will be loaded on first poll"
@@ -205,12 +289,12 @@ class GovernanceEthereum(FuserInput[SensorConfig, Optional[str]]):
         """
         pending_message = await self._raw_to_text(raw_input)
 
-        if pending_message is not None:
-            if len(self.messages) == 0:
-                self.messages.append(pending_message)
-            # only update if there has been a change
-            elif self.messages[-1].message != pending_message.message:
-                self.messages.append(pending_message)
+        # only update if there has been a change
+        if pending_message is None or pending_message.message == self._last_message:
+            return
+
+        self._last_message = pending_message.message
+        self.messages.append(pending_message)
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -2,9 +2,9 @@ import asyncio
 import logging
 import time
 from queue import Queue
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
-import requests
+import aiohttp
 from pydantic import Field
 
 from inputs.base import SensorConfig
@@ -26,6 +26,12 @@ class FabricClosestPeerConfig(SensorConfig):
         Mock latitude.
     mock_lon : Optional[float]
         Mock longitude.
+    coord_tolerance : float
+        GPS change in degrees below which the last peer is reused.
+    peer_refresh_sec : float
+        Maximum age in seconds of a reused closest peer.
+    http_timeout : float
+        Timeout in seconds for Fabric requests.
     """
 
     fabric_endpoint: str = Field(
@@ -34,6 +40,17 @@ class FabricClosestPeerConfig(SensorConfig):
     mock_mode: bool = Field(default=True, description="Mock Mode")
     mock_lat: Optional[float] = Field(default=None, description="Mock Latitude")
     mock_lon: Optional[float] = Field(default=None, description="Mock Longitude")
+    coord_tolerance: float = Field(
+        default=1e-5,
+        description="GPS change in degrees below which the last peer is reused",
+    )
+    peer_refresh_sec: float = Field(
+        default=10.0,
+        description="Maximum age in seconds of a reused closest peer",
+    )
+    http_timeout: float = Field(
+        default=3.0, description="Timeout in seconds for Fabric requests"
+    )
 
 
 class FabricClosestPeer(FuserInput[FabricClosestPeerConfig, Optional[str]]):
@@ -65,6 +82,76 @@ class FabricClosestPeer(FuserInput[FabricClosestPeerConfig, Optional[str]]):
         self.fabric_endpoint = self.config.fabric_endpoint
         self.mock_mode = self.config.mock_mode
 
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=self.config.http_timeout)
+
+        # Last queried position and its closest peer, reused while stationary
+        self._last_coords: Optional[Tuple[float, float]] = None
+        self._last_peer: Optional[Tuple[float, float]] = None
+        self._last_peer_ts = 0.0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Session reused across polls so the Fabric connection stays alive.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session and its pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _listen_loop(self) -> AsyncIterator[Optional[str]]:
+        """
+        Poll continuously and release the HTTP session when the loop ends.
+
+        Yields
+        ------
+        Optional[str]
+            Closest peer messages from polling.
+        """
+        try:
+            while True:
+                yield await self._poll()
+        finally:
+            await asyncio.shield(self.close())
+
+    def _cached_peer(self, lat: float, lon: float) -> Optional[Tuple[float, float]]:
+        """
+        Return the last closest peer if we have not moved since fetching it.
+
+        Parameters
+        ----------
+        lat : float
+            Current latitude.
+        lon : float
+            Current longitude.
+
+        Returns
+        -------
+        Optional[Tuple[float, float]]
+            Cached peer coordinates, or None if a fresh lookup is needed.
+        """
+        if self._last_coords is None or self._last_peer is None:
+            return None
+        if time.monotonic() - self._last_peer_ts >= self.config.peer_refresh_sec:
+            return None
+        last_lat, last_lon = self._last_coords
+        tolerance = self.config.coord_tolerance
+        if abs(lat - last_lat) < tolerance and abs(lon - last_lon) < tolerance:
+            return self._last_peer
+        return None
+
     async def _poll(self) -> Optional[str]:
         """
         Poll Fabric for the closest peer based on our current GPS position.
@@ -83,39 +170,42 @@ class FabricClosestPeer(FuserInput[FabricClosestPeerConfig, Optional[str]]):
                 f"FabricClosestPeer (mock): fabricated peer {peer_lat:.6f},{peer_lon:.6f}"
             )
         else:
-            if requests is None:
-                logging.error(
-                    "FabricClosestPeer: requests not available and mock_mode=False"
-                )
-                return None
             try:
                 lat = self.io.get_dynamic_variable("latitude")
                 lon = self.io.get_dynamic_variable("longitude")
                 if lat is None or lon is None:
                     logging.error("FabricClosestPeer: latitude or longitude not set.")
                     return None
-                logging.info(
-                    f"FabricClosestPeer: fetching closest peer for {lat:.6f}, {lon:.6f}"
-                )
-                resp = requests.post(
-                    self.fabric_endpoint,
-                    json={
-                        "method": "omp2p_findClosestPeer",
-                        "params": [{"latitude": lat, "longitude": lon}],
-                        "id": 1,
-                        "jsonrpc": "2.0",
-                    },
-                    timeout=3.0,
-                    headers={"Content-Type": "application/json"},
-                )
-                data = resp.json()
-                logging.debug(f"FabricClosestPeer response: {data}")
-                peer_info = (data.get("result") or [{}])[0].get("peer")
-                if not peer_info:
-                    logging.info("FabricClosestPeer: no peer found.")
-                    return None
-                peer_lat = peer_info["latitude"]
-                peer_lon = peer_info["longitude"]
+                cached_peer = self._cached_peer(lat, lon)
+                if cached_peer is not None:
+                    peer_lat, peer_lon = cached_peer
+                else:
+                    logging.info(
+                        f"FabricClosestPeer: fetching closest peer for {lat:.6f}, {lon:.6f}"
+                    )
+                    session = self._get_session()
+                    async with session.post(
+                        self.fabric_endpoint,
+                        json={
+                            "method": "omp2p_findClosestPeer",
+                            "params": [{"latitude": lat, "longitude": lon}],
+                            "id": 1,
+                            "jsonrpc": "2.0",
+                        },
+                        timeout=self._timeout,
+                        headers={"Content-Type": "application/json"},
+                    ) as resp:
+                        data = await resp.json()
+                    logging.debug(f"FabricClosestPeer response: {data}")
+                    peer_info = (data.get("result") or [{}])[0].get("peer")
+                    if not peer_info:
+                        logging.info("FabricClosestPeer: no peer found.")
+                        return None
+                    peer_lat = peer_info["latitude"]
+                    peer_lon = peer_info["longitude"]
+                    self._last_coords = (lat, lon)
+                    self._last_peer = (peer_lat, peer_lon)
+                    self._last_peer_ts = time.monotonic()
             except Exception as exc:  # pylint: disable=broad-except
                 logging.error(
                     f"FabricClosestPeer: error calling Fabric endpoint – {exc}"
@@ -1,7 +1,7 @@
 import asyncio
+import threading
 import time
 from collections import deque
-from queue import Empty, Queue
 from typing import Deque, Optional
 
 from pydantic import Field
@@ -66,7 +66,9 @@ class FacePresence(FuserInput[FacePresenceConfig, Optional[str]]):
 
         self.messages: Deque[Message] = deque(maxlen=300)
 
-        self.message_buffer: Queue[str] = Queue(maxsize=64)
+        # Ring buffer fed from the provider thread; append evicts the oldest
+        self.message_buffer: Deque[str] = deque(maxlen=64)
+        self._buffer_lock = threading.Lock()
 
         # Read config and construct the provider WITH required args
         base_url = self.config.face_http_base_url
@@ -85,29 +87,20 @@ class FacePresence(FuserInput[FacePresenceConfig, Optional[str]]):
 
     def _handle_face_message(self, text_line: str) -> None:
         """
-        Provider callback: push a new line into the bounded queue.
+        Provider callback: push a new line into the bounded buffer.
 
         Tasks
         --------
-        - Tries a non-blocking enqueue into `self.message_buffer` (capacity=64).
-        - If the queue is full, drops one oldest item and retries once.
+        - Appends to `self.message_buffer` (capacity=64).
+        - If the buffer is full, the oldest item is evicted automatically.
 
         Parameters
         ----------
         text_line : str
             A single, already formatted line (e.g., "present=[alice], unknown=0, ts=...").
         """
-        try:
-            self.message_buffer.put_nowait(text_line)
-        except Exception:
-            try:
-                _ = self.message_buffer.get_nowait()
-            except Empty:
-                pass
-            try:
-                self.message_buffer.put_nowait(text_line)
-            except Exception:
-                pass
+        with self._buffer_lock:
+            self.message_buffer.append(text_line)
 
     async def _poll(self) -> Optional[str]:
         """
@@ -122,10 +115,10 @@ class FacePresence(FuserInput[FacePresenceConfig, Optional[str]]):
             The next message from the buffer if available, None otherwise
         """
         await asyncio.sleep(0.5)
-        try:
-            return self.message_buffer.get_nowait()
-        except Empty:
-            return None
+        with self._buffer_lock:
+            if self.message_buffer:
+                return self.message_buffer.popleft()
+        return None
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
@@ -1,7 +1,7 @@
 import asyncio
+import threading
 import time
 from collections import deque
-from queue import Empty, Queue
 from typing import Deque, Optional
 
 from pydantic import Field
@@ -51,7 +51,7 @@ class GalleryIdentities(FuserInput[GalleryIdentitiesConfig, Optional[str]]):
 
         Subscribes to `GalleryIdentitiesProvider` and adapts its messages into
         a compact INPUT block for the LLM (“Gallery Identities …”). Uses a small
-        in-memory queue and a bounded deque to hold the latest message.
+        ring buffer and a bounded deque to hold the latest message.
 
         Parameters
         ----------
@@ -63,7 +63,9 @@ class GalleryIdentities(FuserInput[GalleryIdentitiesConfig, Optional[str]]):
         self.io_provider = IOProvider()
 
         self.messages: Deque[Message] = deque(maxlen=300)
-        self.message_buffer: Queue[str] = Queue(maxsize=64)
+        # Ring buffer fed from the provider thread; append evicts the oldest
+        self.message_buffer: Deque[str] = deque(maxlen=64)
+        self._buffer_lock = threading.Lock()
 
         # Config mirrors FacePresence input naming where possible
         base_url = self.config.face_http_base_url
@@ -83,22 +85,15 @@ class GalleryIdentities(FuserInput[GalleryIdentitiesConfig, Optional[str]]):
         """
         Provider callback to enqueue one formatted gallery line.
 
+        The buffer holds 64 lines; when full, the oldest line is evicted.
+
         Parameters
         ----------
         text_line : str
             A single preformatted summary string (e.g., "total=3 ids=[alice, bob, wendy]").
         """
-        try:
-            self.message_buffer.put_nowait(text_line)
-        except Exception:
-            try:
-                _ = self.message_buffer.get_nowait()
-            except Empty:
-                pass
-            try:
-                self.message_buffer.put_nowait(text_line)
-            except Exception:
-                pass
+        with self._buffer_lock:
+            self.message_buffer.append(text_line)
 
     async def _poll(self) -> Optional[str]:
         """
@@ -110,10 +105,10 @@ class GalleryIdentities(FuserInput[GalleryIdentitiesConfig, Optional[str]]):
             The next message from the buffer if available, None otherwise
         """
         await asyncio.sleep(0.5)
-        try:
-            return self.message_buffer.get_nowait()
-        except Empty:
-            return None
+        with self._buffer_lock:
+            if self.message_buffer:
+                return self.message_buffer.popleft()
+        return None
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
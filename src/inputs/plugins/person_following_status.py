@@ -4,15 +4,24 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Deque, Optional
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Optional, Tuple
 
 import aiohttp
-from pydantic import Field
+from pydantic import AnyHttpUrl, Field
+from yarl import URL
 
 from inputs.base import Message, SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
+# Upper bound in seconds for poll and enroll intervals while backing off
+_MAX_BACKOFF = 30.0
+# Doubling steps counted towards the backoff; larger failure counts would
+# overflow the float conversion during a long outage
+_MAX_BACKOFF_EXPONENT = 16
+
 
 class PersonFollowingStatusConfig(SensorConfig):
     """
@@ -20,26 +29,83 @@ class PersonFollowingStatusConfig(SensorConfig):
 
     Parameters
     ----------
-    person_follow_base_url : str
+    person_follow_base_url : AnyHttpUrl
         Base URL for the person-following HTTP service.
     poll_interval : float
-        Polling interval in seconds.
+        Polling interval in seconds, must not be negative.
     enroll_retry_interval : float
-        Interval in seconds between re-enrollment attempts when not tracking.
+        Interval in seconds between re-enrollment attempts when not tracking,
+        must not be negative.
+    uds_path : Optional[str]
+        Unix domain socket of the service. When set, requests go over this
+        socket instead of TCP; the base URL still supplies the Host header.
     """
 
-    person_follow_base_url: str = Field(
-        default="http://localhost:8080",
+    person_follow_base_url: AnyHttpUrl = Field(
+        default=AnyHttpUrl("http://localhost:8080"),
         description="Base URL for the person-following HTTP service",
     )
     poll_interval: float = Field(
         default=0.5,
+        ge=0.0,
         description="Polling interval in seconds",
     )
     enroll_retry_interval: float = Field(
         default=3.0,
+        ge=0.0,
         description="Interval in seconds between re-enrollment attempts when not tracking",
     )
+    uds_path: Optional[str] = Field(
+        default=None,
+        description="Unix domain socket of the person-following service, used instead of TCP when set",
+    )
+
+
+class TrackState(IntEnum):
+    """
+    Tracking state used to decide which status changes to announce.
+    """
+
+    IDLE = 0
+    TRACKING = 1
+    JUST_LOST = 2
+    ANNOUNCED_LOST = 3
+
+
+@dataclass(frozen=True, slots=True)
+class TrackingStatus:
+    """
+    Parsed payload of the person-following /status endpoint.
+    """
+
+    is_tracked: bool = False
+    status: str = "UNKNOWN"
+    x: float = 0.0
+    z: float = 0.0
+    target_track_id: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrackingStatus":
+        """
+        Build a TrackingStatus from the decoded JSON response.
+
+        Parameters
+        ----------
+        data : dict
+            Raw status data from the /status endpoint.
+
+        Returns
+        -------
+        TrackingStatus
+            The status, with defaults for any missing keys.
+        """
+        return cls(
+            is_tracked=data.get("is_tracked", False),
+            status=data.get("status", "UNKNOWN"),
+            x=data.get("x", 0.0),
+            z=data.get("z", 0.0),
+            target_track_id=data.get("target_track_id"),
+        )
 
 
 class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str]]):
@@ -72,80 +138,200 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
         self.io_provider = IOProvider()
         self.messages: Deque[Message] = deque(maxlen=50)
 
-        self.base_url = config.person_follow_base_url
+        self.base_url = str(config.person_follow_base_url)
         self.poll_interval = config.poll_interval
         self.enroll_retry_interval = config.enroll_retry_interval
-        self.status_url = f"{self.base_url}/status"
-        self.enroll_url = f"{self.base_url}/enroll"
+        self.uds_path = config.uds_path
+        # Built once so aiohttp reuses them instead of parsing a string per request
+        self.status_url = URL(self.base_url) / "status"
+        self.enroll_url = URL(self.base_url) / "enroll"
 
         self.descriptor_for_LLM = "Person Following Status"
+        # Fixed head of the prompt block built by formatted_latest_buffer
+        self._prompt_prefix = f"\nINPUT: {self.descriptor_for_LLM}\n// START\n"
+
+        # Shared HTTP session, created on first poll so it binds to the
+        # running loop, then reused so connections to the service stay alive
+        self._session: Optional[aiohttp.ClientSession] = None
 
         # Track previous state for change detection
-        self._previous_is_tracked: Optional[bool] = None
-        self._lost_tracking_time: Optional[float] = None
-        self._lost_tracking_announced: bool = False
-        self._last_enroll_attempt: float = 0.0
+        self._state: TrackState = TrackState.IDLE
+        self._state_since: float = 0.0
+        # Interval bookkeeping uses time.monotonic() so wall-clock jumps
+        # cannot stall re-enrollment or the lost-tracking timer
+        self._last_enroll_attempt: Optional[float] = None
+        # In-flight enroll request, run alongside the following status polls
+        self._enroll_task: Optional[asyncio.Task] = None
         self._has_ever_tracked: bool = False
 
+        # Last steady-tracking message, keyed by its rounded distances and status
+        self._tracking_text: Optional[Tuple[Tuple[float, float, str], str]] = None
+
+        # Consecutive failures, used to back off while the service is down
+        self._consecutive_failures: int = 0
+        self._enroll_failures: int = 0
+
         logging.info(
             f"PersonFollowingStatus initialized, polling {self.status_url} "
             f"every {self.poll_interval}s, re-enroll every {self.enroll_retry_interval}s when not tracking"
         )
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            Session reused by every status poll and enroll request.
+        """
+        if self._session is None or self._session.closed:
+            # Two sockets cover a status poll plus an in-flight enroll
+            connector: aiohttp.BaseConnector
+            if self.uds_path:
+                connector = aiohttp.UnixConnector(
+                    path=self.uds_path, limit=2, keepalive_timeout=75
+                )
+            else:
+                # DNS is cached in case the service is not on localhost
+                connector = aiohttp.TCPConnector(
+                    limit=2,
+                    limit_per_host=2,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session and its pooled connections.
+
+        An enroll request still in flight is cancelled first.
+        """
+        if self._enroll_task is not None and not self._enroll_task.done():
+            self._enroll_task.cancel()
+        self._enroll_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _listen_loop(self) -> AsyncIterator[Optional[str]]:
+        """
+        Poll continuously and release the HTTP session when the loop ends.
+
+        Cancelling the listener task closes the shared session (and any
+        in-flight enroll request) before the cancellation propagates, so
+        pooled sockets are not left for garbage collection.
+
+        Yields
+        ------
+        Optional[str]
+            Formatted status messages from polling.
+        """
+        try:
+            while True:
+                yield await self._poll()
+        finally:
+            await asyncio.shield(self.close())
+
+    @staticmethod
+    def _backoff(interval: float, failures: int) -> float:
+        """
+        Scale an interval exponentially with the number of consecutive failures.
+
+        Parameters
+        ----------
+        interval : float
+            Configured interval in seconds.
+        failures : int
+            Number of consecutive failures. Only the first
+            ``_MAX_BACKOFF_EXPONENT`` count towards the doubling.
+
+        Returns
+        -------
+        float
+            The configured interval when there are no failures, otherwise
+            the doubled interval capped at ``_MAX_BACKOFF``.
+        """
+        if failures <= 0:
+            return interval
+        exponent = min(failures, _MAX_BACKOFF_EXPONENT)
+        return max(interval, min(interval * (2**exponent), _MAX_BACKOFF))
+
     async def _poll(self) -> Optional[str]:
         """
         Poll the person-following status endpoint.
 
         Also periodically calls /enroll when status is INACTIVE (no one enrolled yet).
+        The enroll request runs as a background task so it does not delay
+        this poll's result; at most one is in flight at a time.
         Does NOT re-enroll when status is SEARCHING (person enrolled but temporarily lost).
+        Consecutive failures back off the poll interval exponentially up to
+        ``_MAX_BACKOFF``; the first successful response restores it.
 
         Returns
         -------
         Optional[str]
             Formatted status message if there's a meaningful update, None otherwise.
         """
-        await asyncio.sleep(self.poll_interval)
+        delay = self._backoff(self.poll_interval, self._consecutive_failures)
+        # A non-positive interval only yields to the loop, no timer needed
+        await asyncio.sleep(delay if delay > 0 else 0)
+
+        now = time.monotonic()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # First, get current status
-                async with session.get(
-                    self.status_url,
-                    timeout=aiohttp.ClientTimeout(total=2),
-                ) as response:
-                    if response.status != 200:
-                        return None
-
-                    data = await response.json()
-                    is_tracked = data.get("is_tracked", False)
-                    status = data.get("status", "UNKNOWN")
-                    target_track_id = data.get("target_track_id")
-
-                    # If tracking, remember we've successfully tracked
-                    if is_tracked:
-                        self._has_ever_tracked = True
-
-                    # Only retry enrollment if INACTIVE (no one enrolled yet)
-                    # Do NOT re-enroll if SEARCHING (person enrolled but temporarily out of frame)
-                    if status == "INACTIVE" and target_track_id is None:
-                        current_time = time.time()
-                        time_since_last_enroll = (
-                            current_time - self._last_enroll_attempt
+            session = self._get_session()
+            # First, get current status
+            async with session.get(
+                self.status_url,
+                timeout=aiohttp.ClientTimeout(total=2),
+            ) as response:
+                if response.status != 200:
+                    self._consecutive_failures += 1
+                    return None
+
+                data = TrackingStatus.from_dict(await response.json())
+                self._consecutive_failures = 0
+
+                # If tracking, remember we've successfully tracked
+                if data.is_tracked:
+                    self._has_ever_tracked = True
+
+                # Steady-state tracking: nothing to enroll, go straight to formatting
+                if data.status == "TRACKING_ACTIVE":
+                    return self._format_status(data, now)
+
+                # Only retry enrollment if INACTIVE (no one enrolled yet)
+                # Do NOT re-enroll if SEARCHING (person enrolled but temporarily out of frame)
+                if data.status == "INACTIVE" and data.target_track_id is None:
+                    enroll_interval = self._backoff(
+                        self.enroll_retry_interval, self._enroll_failures
+                    )
+                    enroll_pending = (
+                        self._enroll_task is not None and not self._enroll_task.done()
+                    )
+                    if not enroll_pending and (
+                        self._last_enroll_attempt is None
+                        or now - self._last_enroll_attempt >= enroll_interval
+                    ):
+                        self._last_enroll_attempt = now
+                        logging.info(
+                            "PersonFollowingStatus: Status INACTIVE, attempting enrollment"
+                        )
+                        self._enroll_task = asyncio.create_task(
+                            self._try_enroll(session)
                         )
 
-                        if time_since_last_enroll >= self.enroll_retry_interval:
-                            self._last_enroll_attempt = current_time
-                            logging.info(
-                                "PersonFollowingStatus: Status INACTIVE, attempting enrollment"
-                            )
-                            await self._try_enroll(session)
-
-                    return self._format_status(data)
+                return self._format_status(data, now)
 
         except aiohttp.ClientError as e:
+            self._consecutive_failures += 1
             logging.debug(f"PersonFollowingStatus: Poll failed: {e}")
             return None
         except Exception as e:
+            self._consecutive_failures += 1
             logging.warning(f"PersonFollowingStatus: Unexpected error: {e}")
             return None
 
@@ -164,16 +350,21 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
                 timeout=aiohttp.ClientTimeout(total=3),
             ) as response:
                 if response.status == 200:
+                    self._enroll_failures = 0
                     logging.info("PersonFollowingStatus: Re-enrollment request sent")
                 else:
+                    self._enroll_failures += 1
                     logging.debug(
                         f"PersonFollowingStatus: Enroll returned status {response.status}"
                     )
         except Exception as e:
+            self._enroll_failures += 1
             logging.debug(f"PersonFollowingStatus: Enroll request failed: {e}")
             return None
 
-    def _format_status(self, data: dict) -> Optional[str]:
+    def _format_status(
+        self, data: TrackingStatus, now: Optional[float] = None
+    ) -> Optional[str]:
         """
         Format the status data into a human-readable message for the LLM.
 
@@ -187,50 +378,43 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
 
         Parameters
         ----------
-        data : dict
-            Raw status data from the /status endpoint.
+        data : TrackingStatus
+            Parsed status from the /status endpoint.
+        now : Optional[float]
+            Current ``time.monotonic()`` reading; taken here when not given.
 
         Returns
         -------
         Optional[str]
             Formatted status message or None if no update needed.
         """
-        is_tracked = data.get("is_tracked", False)
-        x = data.get("x", 0.0)
-        z = data.get("z", 0.0)
-        status = data.get("status", "UNKNOWN")
-        target_track_id = data.get("target_track_id")
+        is_tracked = data.is_tracked
+        x = data.x
+        z = data.z
+        status = data.status
+        target_track_id = data.target_track_id
 
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
 
-        # Detect state changes
-        tracking_just_started = (
-            self._previous_is_tracked is not True and is_tracked is True
-        )
-        tracking_just_lost = self._previous_is_tracked is True and is_tracked is False
-
-        self._previous_is_tracked = is_tracked
-
-        if tracking_just_started:
+        if is_tracked and self._state != TrackState.TRACKING:
             # Person was acquired - always report this
-            self._lost_tracking_time = None
-            self._lost_tracking_announced = False
+            self._state = TrackState.TRACKING
+            self._state_since = current_time
             return f"TRACKING STARTED: Person detected and now following. Distance: {z:.1f}m ahead, {x:.1f}m to the side."
 
-        if tracking_just_lost:
-            # Person was lost - start timer but don't announce immediately
-            self._lost_tracking_time = current_time
-            self._lost_tracking_announced = False
-            return None
-
         if not is_tracked:
-            # Check if we should announce based on status
+            if self._state == TrackState.TRACKING:
+                # Person was lost - start timer but don't announce immediately
+                self._state = TrackState.JUST_LOST
+                self._state_since = current_time
+                return None
+
+            # Announce once the person has been gone for a while
             if (
-                self._lost_tracking_time is not None
-                and not self._lost_tracking_announced
-                and (current_time - self._lost_tracking_time) > 2.0
+                self._state == TrackState.JUST_LOST
+                and (current_time - self._state_since) > 2.0
             ):
-                self._lost_tracking_announced = True
+                self._state = TrackState.ANNOUNCED_LOST
                 if status == "SEARCHING" and target_track_id is not None:
                     # Person was enrolled but went out of frame - they'll be re-acquired automatically
                     return "SEARCHING: Person went out of view. Looking for them to return."
@@ -242,8 +426,15 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
             return None
 
         # Currently tracking - provide occasional updates
-        # Only report significant distance changes or periodically
-        return f"TRACKING: Following person at {z:.1f}m ahead, {x:.1f}m to the side. Status: {status}"
+        # Reuse the previous text while the rounded distances are unchanged;
+        # adding 0.0 folds -0.0 into 0.0 so both share one entry
+        key = (round(z, 1) + 0.0, round(x, 1) + 0.0, status)
+        if self._tracking_text is not None and self._tracking_text[0] == key:
+            return self._tracking_text[1]
+
+        text = f"TRACKING: Following person at {key[0]:.1f}m ahead, {key[1]:.1f}m to the side. Status: {status}"
+        self._tracking_text = (key, text)
+        return text
 
     async def _raw_to_text(self, raw_input: Optional[str]) -> Optional[Message]:
         """
@@ -290,17 +481,11 @@ class PersonFollowingStatus(FuserInput[PersonFollowingStatusConfig, Optional[str
             A formatted multi-line string ready for LLM consumption,
             or None if there are no messages.
         """
-        if len(self.messages) == 0:
+        if not self.messages:
             return None
 
         latest_message = self.messages[-1]
-
-        result = f"""
-INPUT: {self.descriptor_for_LLM}
-// START
-{latest_message.message}
-// END
-"""
+        result = self._prompt_prefix + latest_message.message + "\n// END\n"
 
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
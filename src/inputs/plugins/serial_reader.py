@@ -136,11 +136,17 @@ class SerialReader(FuserInput[SensorConfig, Optional[str]]):
             return None
 
         if "Pulse:" in raw_input:
-            value = raw_input.split(" ")
-            message = f"The child's pulse rate is {value[1]}."
+            value = raw_input.split("Pulse:", 1)[1].strip()
+            if value:
+                message = f"The child's pulse rate is {value}."
+            else:
+                message = "The child's pulse rate reading is missing."
         elif "Grip:" in raw_input:
-            value = raw_input.split(" ")
-            message = f"The child's grip strength is {value[1]}."
+            value = raw_input.split("Grip:", 1)[1].strip()
+            if value:
+                message = f"The child's grip strength is {value}."
+            else:
+                message = "The child's grip strength reading is missing."
         else:
             message = "No serial data."
 
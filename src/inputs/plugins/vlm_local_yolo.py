@@ -3,6 +3,7 @@ import json
 import logging
 import os
 import time
+import weakref
 from typing import List, Optional
 
 import cv2
@@ -86,14 +87,18 @@ def check_webcam(index_to_check):
     Checks if a webcam is available and returns True if found, False otherwise.
     """
     cap = cv2.VideoCapture(index_to_check)
-    if not cap.isOpened():
-        logging.error(f"YOLO did not find cam: {index_to_check}")
-        return 0, 0
+    try:
+        if not cap.isOpened():
+            logging.error(f"YOLO did not find cam: {index_to_check}")
+            return 0, 0
 
-    # Set the best available resolution
-    width, height = set_best_resolution(cap, RESOLUTIONS)
-    logging.info(f"YOLO found cam: {index_to_check} set to {width}{height}")
-    return width, height
+        # Set the best available resolution
+        width, height = set_best_resolution(cap, RESOLUTIONS)
+        logging.info(f"YOLO found cam: {index_to_check} set to {width}{height}")
+        return width, height
+    finally:
+        # Only probing here; the input opens its own capture
+        cap.release()
 
 
 class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
@@ -144,8 +149,12 @@ class VLM_Local_YOLO(FuserInput[VLM_Local_YOLOConfig, Optional[List]]):
 
         # Start capturing video, if we have a webcam
         self.cap = None
+        self._release_cap: Optional[weakref.finalize] = None
         if self.have_cam:
             self.cap = cv2.VideoCapture(self.camera_index)
+            # The runtime has no input shutdown hook, so the camera is
+            # released when this input is garbage collected
+            self._release_cap = weakref.finalize(self, self.cap.release)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cam_third = int(self.width / 3)
@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+import hooks.person_follow_hook as _pfh
+
+
+@pytest.fixture
+def pfh():
+    return _pfh
+
+
+@pytest.fixture(autouse=True)
+def reset_tts_provider(monkeypatch):
+    monkeypatch.setattr(_pfh, "_tts_provider", None)
+
+
+@pytest.fixture(autouse=True)
+def reset_healthy_retries(monkeypatch):
+    monkeypatch.setattr(_pfh, "_healthy_retries", None)
+
+
+@pytest.fixture
+def mock_elevenlabs(monkeypatch):
+    mock_instance = Mock()
+    monkeypatch.setattr(_pfh, "ElevenLabsTTSProvider", Mock(return_value=mock_instance))
+    yield mock_instance
+
+
+@pytest.fixture
+def make_response():
+    """Factory for aiohttp responses usable as async context managers."""
+
+    def _make(status: int = 200, json_data=None):
+        response = MagicMock()
+        response.status = status
+        response.json = AsyncMock(return_value=json_data or {})
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    return _make
+
+
+@pytest.fixture
+def mock_aiohttp_session():
+    """Factory for shared aiohttp sessions with canned post/get responses."""
+
+    def _make(
+        post_response=None,
+        get_response=None,
+        post_side_effect=None,
+        get_side_effect=None,
+    ):
+        session = MagicMock()
+        session.closed = False
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        if post_response is not None:
+            session.post.return_value = post_response
+        if get_response is not None:
+            session.get.return_value = get_response
+        if post_side_effect is not None:
+            session.post.side_effect = post_side_effect
+        if get_side_effect is not None:
+            session.get.side_effect = get_side_effect
+        return session
+
+    return _make
@@ -0,0 +1,497 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import aiohttp
+import pytest
+
+from hooks.person_follow_hook import start_person_follow_hook, stop_person_follow_hook
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class TestContextValidation:
+    async def test_context_default_base_url(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": True}),
+        )
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({})
+
+        assert "localhost:8080" in mock_session.post.call_args.args[0]
+
+    async def test_context_custom_base_url(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": True}),
+        )
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook(
+                {"person_follow_base_url": "http://robot.local:9000"}
+            )
+
+        assert "robot.local:9000/enroll" in mock_session.post.call_args.args[0]
+
+    async def test_context_zero_max_retries(
+        self, mock_aiohttp_session, mock_elevenlabs
+    ):
+        mock_session = mock_aiohttp_session()
+
+        with patch("hooks.person_follow_hook._get_session", return_value=mock_session):
+            result = await start_person_follow_hook({"max_retries": 0})
+
+        assert result["status"] == "success"
+        assert result["is_tracked"] is False
+        mock_session.post.assert_not_called()
+
+    async def test_stop_context_default_base_url(
+        self, mock_aiohttp_session, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(200))
+
+        with patch("hooks.person_follow_hook._get_session", return_value=mock_session):
+            await stop_person_follow_hook({})
+
+        assert "localhost:8080" in mock_session.post.call_args.args[0]
+
+
+class TestStartPersonFollowHook:
+    async def test_success_when_tracked(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": True}),
+        )
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({})
+
+        assert result == {
+            "status": "success",
+            "message": "Person enrolled and tracking",
+            "is_tracked": True,
+        }
+        mock_elevenlabs.add_pending_message.assert_called_once_with(
+            "I see you! I'll follow you now."
+        )
+
+    async def test_awaiting_detection_when_never_tracked(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": False}),
+        )
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook(
+                {"max_retries": 2, "enroll_timeout": 0.5}
+            )
+
+        assert result["status"] == "success"
+        assert result["is_tracked"] is False
+        mock_elevenlabs.add_pending_message.assert_called_once_with(
+            "Person following mode activated. Please stand in front of me."
+        )
+
+    async def test_connection_error(self, mock_elevenlabs):
+        with patch(
+            "hooks.person_follow_hook._get_session",
+            side_effect=aiohttp.ClientError("Connection refused"),
+        ):
+            result = await start_person_follow_hook({})
+
+        assert result["status"] == "error"
+        assert "Connection refused" in result["message"]
+        mock_elevenlabs.add_pending_message.assert_called_once_with(
+            "I couldn't connect to the person following system."
+        )
+
+
+class TestStartHookBehaviorCorrectness:
+    async def test_retry_stops_when_tracked(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(200))
+        mock_session.get.side_effect = [
+            make_response(200, {"is_tracked": False}),
+            make_response(200, {"is_tracked": False}),
+            make_response(200, {"is_tracked": True}),
+        ]
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook(
+                {"max_retries": 5, "enroll_timeout": 1.0}
+            )
+
+        assert result["is_tracked"] is True
+        assert mock_session.post.call_count == 2
+        assert mock_session.get.call_count == 3
+
+    async def test_timeout_respected_per_attempt(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": False}),
+        )
+        mock_sleep = AsyncMock()
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=mock_sleep),
+        ):
+            await start_person_follow_hook(
+                {"max_retries": 2, "enroll_timeout": 1.5, "base_delay": 0.0}
+            )
+
+        assert mock_session.post.call_count == 2
+        assert mock_session.get.call_count == 6
+        assert mock_sleep.await_count == 6
+
+    async def test_long_poll_single_request_per_attempt(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": False}),
+        )
+        mock_sleep = AsyncMock()
+
+        # The server holds each status request for the rest of the attempt
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=mock_sleep),
+            patch("hooks.person_follow_hook.time") as mock_time,
+        ):
+            mock_time.monotonic.side_effect = [0.0, 2.5, 10.0, 12.5]
+            await start_person_follow_hook(
+                {"max_retries": 2, "enroll_timeout": 3.0, "base_delay": 0.0}
+            )
+
+        assert mock_session.post.call_count == 2
+        assert mock_session.get.call_count == 2
+        assert mock_sleep.await_count == 2
+        assert mock_session.get.call_args.kwargs["params"] == {"wait": 2.5}
+
+    async def test_backoff_between_attempts(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(500))
+        mock_sleep = AsyncMock()
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=mock_sleep),
+            patch("hooks.person_follow_hook.random") as mock_random,
+        ):
+            mock_random.uniform.return_value = 0.5
+            await start_person_follow_hook({"max_retries": 3})
+
+        assert mock_sleep.await_args_list == [call(1.5), call(3.0)]
+
+    async def test_backoff_capped_at_max_delay(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(503))
+        mock_sleep = AsyncMock()
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=mock_sleep),
+        ):
+            await start_person_follow_hook(
+                {"max_retries": 3, "base_delay": 10.0, "max_delay": 15.0, "jitter": 0}
+            )
+
+        assert mock_sleep.await_args_list == [call(10.0), call(15.0)]
+
+    async def test_enroll_4xx_fails_fast(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(404))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({"max_retries": 5})
+
+        assert result == {
+            "status": "error",
+            "message": "Enroll rejected with status 404",
+        }
+        assert mock_session.post.call_count == 1
+        mock_session.get.assert_not_called()
+
+    async def test_enroll_timeout_moves_to_next_attempt(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session()
+        timed_out_post = make_response(200)
+        timed_out_post.__aenter__ = AsyncMock(side_effect=asyncio.TimeoutError())
+        mock_session.post.side_effect = [timed_out_post, make_response(200)]
+        mock_session.get.return_value = make_response(200, {"is_tracked": True})
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({"max_retries": 2})
+
+        assert result["is_tracked"] is True
+        assert mock_session.post.call_count == 2
+
+    async def test_enroll_non_200_skips_status_poll(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(post_response=make_response(500))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({"max_retries": 3})
+
+        assert result["is_tracked"] is False
+        assert mock_session.post.call_count == 3
+        mock_session.get.assert_not_called()
+
+    async def test_enroll_client_error_moves_to_next_attempt(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session()
+        failing_post = make_response(200)
+        failing_post.__aenter__ = AsyncMock(
+            side_effect=aiohttp.ClientError("Enroll refused")
+        )
+        mock_session.post.side_effect = [failing_post, make_response(200)]
+        mock_session.get.return_value = make_response(200, {"is_tracked": True})
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({"max_retries": 2})
+
+        assert result["is_tracked"] is True
+        assert mock_session.post.call_count == 2
+
+    async def test_status_poll_exception_is_swallowed(
+        self, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_side_effect=Exception("Status unavailable"),
+        )
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook(
+                {"max_retries": 1, "enroll_timeout": 0.5}
+            )
+
+        assert result["status"] == "success"
+        assert result["is_tracked"] is False
+
+
+class TestStopHookBehaviorCorrectness:
+    async def test_stop_success(self, mock_aiohttp_session, make_response):
+        mock_session = mock_aiohttp_session(post_response=make_response(200))
+
+        with patch("hooks.person_follow_hook._get_session", return_value=mock_session):
+            result = await stop_person_follow_hook(
+                {"person_follow_base_url": "http://robot.local:9000"}
+            )
+
+        assert result == {"status": "success", "message": "Person tracking stopped"}
+        assert "robot.local:9000/clear" in mock_session.post.call_args.args[0]
+
+    async def test_stop_non_200(self, mock_aiohttp_session, make_response):
+        mock_session = mock_aiohttp_session(post_response=make_response(500))
+
+        with patch("hooks.person_follow_hook._get_session", return_value=mock_session):
+            result = await stop_person_follow_hook({})
+
+        assert result == {"status": "error", "message": "Clear failed"}
+
+    async def test_stop_connection_error(self, mock_aiohttp_session, make_response):
+        mock_session = mock_aiohttp_session()
+        failing_post = make_response(200)
+        failing_post.__aenter__ = AsyncMock(
+            side_effect=aiohttp.ClientError("Connection refused")
+        )
+        mock_session.post.return_value = failing_post
+
+        with patch("hooks.person_follow_hook._get_session", return_value=mock_session):
+            result = await stop_person_follow_hook({})
+
+        assert result["status"] == "error"
+        assert "Connection refused" in result["message"]
+
+
+class TestElevenLabsProviderBehavior:
+    async def test_provider_reused_across_calls(
+        self, mock_aiohttp_session, pfh, make_response, monkeypatch
+    ):
+        creation_count = 0
+
+        def create_provider(*args, **kwargs):
+            nonlocal creation_count
+            creation_count += 1
+            return Mock()
+
+        mock_session = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": True}),
+        )
+
+        monkeypatch.setattr(pfh, "ElevenLabsTTSProvider", create_provider)
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=mock_session),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({})
+            await start_person_follow_hook({})
+
+        # Guards the module-level cache: a provider per call would double this
+        assert creation_count == 1
+        assert pfh._tts_provider is pfh._get_tts_provider()
+
+
+class TestSharedSession:
+    async def test_session_reused_across_calls(self, pfh, monkeypatch):
+        monkeypatch.setattr(pfh, "_session", None)
+
+        first = pfh._get_session()
+        second = pfh._get_session()
+
+        assert first is second
+        await first.close()
+
+    async def test_closed_session_is_replaced(self, pfh, monkeypatch):
+        monkeypatch.setattr(pfh, "_session", None)
+
+        first = pfh._get_session()
+        await first.close()
+        second = pfh._get_session()
+
+        assert second is not first
+        assert not second.closed
+        await second.close()
+
+    async def test_close_hook_closes_session(self, pfh, monkeypatch):
+        monkeypatch.setattr(pfh, "_session", None)
+        session = pfh._get_session()
+
+        result = await pfh.close_person_follow_session({})
+
+        assert result["status"] == "success"
+        assert session.closed
+        assert pfh._session is None
+
+
+class TestAdaptiveRetries:
+    async def test_budget_shrinks_after_quick_success(
+        self, pfh, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        tracked = mock_aiohttp_session(
+            post_response=make_response(200),
+            get_response=make_response(200, {"is_tracked": True}),
+        )
+        failing = mock_aiohttp_session(post_response=make_response(500))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=tracked),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({"max_retries": 5})
+
+        assert pfh._healthy_retries == 1
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=failing),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({"max_retries": 5})
+
+        assert failing.post.call_count == 3
+
+    async def test_budget_restored_after_failure(
+        self, pfh, monkeypatch, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        monkeypatch.setattr(pfh, "_healthy_retries", 1)
+        failing = mock_aiohttp_session(post_response=make_response(500))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=failing),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({"max_retries": 5})
+            await start_person_follow_hook({"max_retries": 5})
+
+        assert pfh._healthy_retries is None
+        assert failing.post.call_count == 3 + 5
+
+    async def test_budget_restored_after_rejection(
+        self, pfh, monkeypatch, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        monkeypatch.setattr(pfh, "_healthy_retries", 1)
+        rejected = mock_aiohttp_session(post_response=make_response(403))
+        failing = mock_aiohttp_session(post_response=make_response(500))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=rejected),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await start_person_follow_hook({"max_retries": 5})
+
+        assert result["message"] == "Enroll rejected with status 403"
+        assert pfh._healthy_retries is None
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=failing),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({"max_retries": 5})
+
+        assert failing.post.call_count == 5
+
+    async def test_budget_never_exceeds_max_retries(
+        self, pfh, monkeypatch, mock_aiohttp_session, mock_elevenlabs, make_response
+    ):
+        monkeypatch.setattr(pfh, "_healthy_retries", 4)
+        failing = mock_aiohttp_session(post_response=make_response(500))
+
+        with (
+            patch("hooks.person_follow_hook._get_session", return_value=failing),
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            await start_person_follow_hook({"max_retries": 2})
+
+        assert failing.post.call_count == 2
@@ -1,10 +1,14 @@
 import asyncio
-from unittest.mock import patch
+from collections import deque
+from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from inputs.base import SensorConfig
-from inputs.plugins.ethereum_governance import GovernanceEthereum
+from inputs.plugins.ethereum_governance import (
+    GovernanceEthereum,
+    GovernanceEthereumConfig,
+)
 
 
 class MockResponse:
@@ -23,6 +27,8 @@ class MockClientSession:
 
     def __init__(self, response: MockResponse):
         self._response = response
+        self.closed = False
+        self.post_calls = 0
 
     async def __aenter__(self):
         return self
@@ -31,6 +37,7 @@ class MockClientSession:
         pass
 
     def post(self, *args, **kwargs):
+        self.post_calls += 1
         return MockPostContext(self._response)
 
 
@@ -49,7 +56,7 @@ class MockPostContext:
 
 @pytest.fixture
 def governance():
-    return GovernanceEthereum(config=SensorConfig())
+    return GovernanceEthereum(config=GovernanceEthereumConfig())
 
 
 @pytest.mark.asyncio
@@ -130,8 +137,119 @@ async def test_poll_returns_rules(governance):
     assert "Hello" in result
 
 
+HELLO_RESULT = (
+    "0x"
+    + "0" * 64
+    + "0" * 64
+    + "0" * 64
+    + "0000000000000000000000000000000000000000000000000000000000000005"
+    + "48656c6c6f"
+    + "0" * 54
+)
+
+
+@pytest.mark.asyncio
+async def test_load_rules_cached_within_ttl(governance):
+    session = MockClientSession(
+        MockResponse(status=200, json_data={"result": HELLO_RESULT})
+    )
+
+    with patch(
+        "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
+        return_value=session,
+    ):
+        first = await governance.load_rules_from_blockchain()
+        second = await governance.load_rules_from_blockchain()
+
+    assert first == second == "Hello"
+    assert session.post_calls == 1
+
+
+def test_config_rules_ttl():
+    assert GovernanceEthereumConfig().rules_ttl == 60.0
+    assert (
+        GovernanceEthereum(config=GovernanceEthereumConfig(rules_ttl=5.0))._rules_ttl
+        == 5.0
+    )
+
+    with pytest.raises(ValidationError):
+        GovernanceEthereumConfig(rules_ttl=-1.0)
+
+
+@pytest.mark.asyncio
+async def test_load_rules_refetched_after_ttl():
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig(rules_ttl=0))
+    session = MockClientSession(
+        MockResponse(status=200, json_data={"result": HELLO_RESULT})
+    )
+
+    with patch(
+        "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
+        return_value=session,
+    ):
+        await governance.load_rules_from_blockchain()
+        await governance.load_rules_from_blockchain()
+
+    assert session.post_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_load_rules_failure_not_cached(governance):
+    session = MockClientSession(MockResponse(status=500, json_data={}))
+
+    with patch(
+        "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
+        return_value=session,
+    ):
+        assert await governance.load_rules_from_blockchain() is None
+        assert await governance.load_rules_from_blockchain() is None
+
+    assert session.post_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_session_reused_across_calls():
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig(rules_ttl=0))
+    mock_client_session = Mock(
+        return_value=MockClientSession(
+            MockResponse(status=200, json_data={"result": HELLO_RESULT})
+        )
+    )
+
+    with patch(
+        "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
+        mock_client_session,
+    ):
+        await governance.load_rules_from_blockchain()
+        await governance.load_rules_from_blockchain()
+
+    assert mock_client_session.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_closed_session_is_replaced():
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig(rules_ttl=0))
+    first = MockClientSession(
+        MockResponse(status=200, json_data={"result": HELLO_RESULT})
+    )
+    second = MockClientSession(
+        MockResponse(status=200, json_data={"result": HELLO_RESULT})
+    )
+
+    with patch(
+        "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
+        side_effect=[first, second],
+    ):
+        await governance.load_rules_from_blockchain()
+        first.closed = True
+        await governance.load_rules_from_blockchain()
+
+    assert first.post_calls == 1
+    assert second.post_calls == 1
+
+
 def test_governance_initialization():
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     assert governance.rpc_url == "https://holesky.drpc.org"
     assert governance.contract_address == "0xe706b7e30e378b89c7b2ee7bfd8ce2b91959d695"
@@ -141,7 +259,7 @@ def test_governance_initialization():
 
 
 def test_decode_eth_response_valid():
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     # Encoded "Hello" string
     hex_response = (
@@ -159,7 +277,7 @@ def test_decode_eth_response_valid():
 
 
 def test_decode_eth_response_invalid():
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     result = governance.decode_eth_response("invalid_hex")
     assert result is None
@@ -225,7 +343,7 @@ async def test_load_rules_is_non_blocking():
 
     async def governance_call():
         nonlocal call_start, call_end
-        governance = GovernanceEthereum(config=SensorConfig())
+        governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
         with patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
@@ -261,7 +379,7 @@ async def test_poll_is_non_blocking():
 
     async def poll_call():
         nonlocal poll_start, poll_end
-        governance = GovernanceEthereum(config=SensorConfig())
+        governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
         with patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
@@ -322,7 +440,7 @@ class MockPostContextWithError:
 @pytest.mark.asyncio
 async def test_load_rules_handles_client_error():
     """Test that load_rules_from_blockchain handles aiohttp.ClientError."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     with patch(
         "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
@@ -336,7 +454,7 @@ async def test_load_rules_handles_client_error():
 @pytest.mark.asyncio
 async def test_load_rules_handles_timeout():
     """Test that load_rules_from_blockchain handles asyncio.TimeoutError."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     with patch(
         "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
@@ -350,7 +468,7 @@ async def test_load_rules_handles_timeout():
 @pytest.mark.asyncio
 async def test_load_rules_handles_generic_error():
     """Test that load_rules_from_blockchain handles generic exceptions."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     with patch(
         "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
@@ -364,7 +482,7 @@ async def test_load_rules_handles_generic_error():
 @pytest.mark.asyncio
 async def test_poll_handles_exception():
     """Test that _poll handles exceptions from load_rules_from_blockchain."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
     governance.POLL_INTERVAL = 0.01
 
     with patch.object(
@@ -380,7 +498,7 @@ async def test_poll_handles_exception():
 @pytest.mark.asyncio
 async def test_raw_to_text_with_none():
     """Test that _raw_to_text returns None when given None input."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     result = await governance._raw_to_text(None)
     assert result is None
@@ -389,7 +507,7 @@ async def test_raw_to_text_with_none():
 @pytest.mark.asyncio
 async def test_raw_to_text_with_valid_input():
     """Test that _raw_to_text converts valid input to Message."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     result = await governance._raw_to_text("Test rules")
     assert result is not None
@@ -400,7 +518,7 @@ async def test_raw_to_text_with_valid_input():
 @pytest.mark.asyncio
 async def test_raw_to_text_buffer_management():
     """Test that raw_to_text manages message buffer correctly."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     await governance.raw_to_text("First rule")
     assert len(governance.messages) == 1
@@ -417,7 +535,7 @@ async def test_raw_to_text_buffer_management():
 @pytest.mark.asyncio
 async def test_raw_to_text_with_none_input():
     """Test that raw_to_text with None input does not modify messages."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     await governance.raw_to_text(None)
     assert len(governance.messages) == 0
@@ -425,7 +543,7 @@ async def test_raw_to_text_with_none_input():
 
 def test_formatted_latest_buffer_empty():
     """Test that formatted_latest_buffer returns None when messages is empty."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     result = governance.formatted_latest_buffer()
     assert result is None
@@ -435,8 +553,11 @@ def test_formatted_latest_buffer_with_message():
     """Test that formatted_latest_buffer returns correctly formatted string."""
     from inputs.base import Message
 
-    governance = GovernanceEthereum(config=SensorConfig())
-    governance.messages = [Message(timestamp=12345.0, message="Test governance rule")]
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
+    governance.messages = deque(
+        [Message(timestamp=12345.0, message="Test governance rule")], maxlen=1024
+    )
+    governance._last_message = "Test governance rule"
 
     with patch.object(governance.io_provider, "add_input") as mock_add_input:
         result = governance.formatted_latest_buffer()
@@ -451,7 +572,7 @@ def test_formatted_latest_buffer_with_message():
 
 def test_decode_eth_response_too_short():
     """Test that decode_eth_response handles too-short hex responses gracefully."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     # Hex response shorter than 128 bytes (required for string_length read at bytes 96-128)
     short_hex = "0x" + "00" * 50  # Only 50 bytes, less than required 128
@@ -463,7 +584,7 @@ def test_decode_eth_response_too_short():
 
 def test_decode_eth_response_with_control_characters():
     """Test that decode_eth_response correctly strips unwanted control characters."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     # Build hex with control character \x19 embedded in "Hello\x19World"
     # String: "Hello\x19World" = 11 bytes
@@ -486,7 +607,7 @@ def test_decode_eth_response_with_control_characters():
 
 def test_decode_eth_response_without_0x_prefix():
     """Test that decode_eth_response works with hex strings missing '0x' prefix."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     # Same as valid test but without "0x" prefix
     hex_response = (
@@ -505,7 +626,7 @@ def test_decode_eth_response_without_0x_prefix():
 @pytest.mark.asyncio
 async def test_load_rules_missing_result_key():
     """Test that load_rules_from_blockchain handles missing 'result' key in response."""
-    governance = GovernanceEthereum(config=SensorConfig())
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
 
     mock_response = MockResponse(
         status=200,
@@ -525,11 +646,15 @@ def test_formatted_latest_buffer_does_not_clear_messages():
     """Test that formatted_latest_buffer does not clear messages after formatting."""
     from inputs.base import Message
 
-    governance = GovernanceEthereum(config=SensorConfig())
-    governance.messages = [
-        Message(timestamp=12345.0, message="First rule"),
-        Message(timestamp=12346.0, message="Second rule"),
-    ]
+    governance = GovernanceEthereum(config=GovernanceEthereumConfig())
+    governance.messages = deque(
+        [
+            Message(timestamp=12345.0, message="First rule"),
+            Message(timestamp=12346.0, message="Second rule"),
+        ],
+        maxlen=1024,
+    )
+    governance._last_message = "Second rule"
 
     with patch.object(governance.io_provider, "add_input"):
         governance.formatted_latest_buffer()
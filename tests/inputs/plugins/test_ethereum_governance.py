@@ -1,11 +1,15 @@
 import asyncio
 import time
+from collections import deque
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from inputs.base import SensorConfig
-from inputs.plugins.ethereum_governance import GovernanceEthereum, Message
+from inputs.plugins.ethereum_governance import (
+    GovernanceEthereum,
+    GovernanceEthereumConfig,
+    Message,
+)
 
 
 @pytest.fixture
@@ -18,7 +22,7 @@ def mock_io_provider():
 
 @pytest.fixture
 def governance_instance(mock_io_provider):
-    config = SensorConfig()
+    config = GovernanceEthereumConfig()
     with patch(
         "inputs.plugins.ethereum_governance.IOProvider", return_value=mock_io_provider
     ):
@@ -48,10 +52,6 @@ async def test_load_rules_from_blockchain_success_scenario(governance_instance):
     mock_session = Mock()
     mock_session.post.return_value = mock_session_post_cm
 
-    mock_client_session_cm = AsyncMock()
-    mock_client_session_cm.__aenter__.return_value = mock_session
-    mock_client_session_cm.__aexit__.return_value = None
-
     # Patch decode_eth_response to return a predictable value
     with (
         patch.object(
@@ -59,7 +59,7 @@ async def test_load_rules_from_blockchain_success_scenario(governance_instance):
         ),
         patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
-            return_value=mock_client_session_cm,
+            return_value=mock_session,
         ),
     ):
         result = await governance_instance.load_rules_from_blockchain()
@@ -82,15 +82,11 @@ async def test_load_rules_from_blockchain_http_error(governance_instance, caplog
     mock_session = Mock()
     mock_session.post.return_value = mock_session_post_cm
 
-    mock_client_session_cm = AsyncMock()
-    mock_client_session_cm.__aenter__.return_value = mock_session
-    mock_client_session_cm.__aexit__.return_value = None
-
     with (
         caplog.at_level("ERROR"),
         patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
-            return_value=mock_client_session_cm,
+            return_value=mock_session,
         ),
     ):
         result = await governance_instance.load_rules_from_blockchain()
@@ -116,15 +112,11 @@ async def test_load_rules_from_blockchain_no_result_in_response(
     mock_session = Mock()
     mock_session.post.return_value = mock_session_post_cm
 
-    mock_client_session_cm = AsyncMock()
-    mock_client_session_cm.__aenter__.return_value = mock_session
-    mock_client_session_cm.__aexit__.return_value = None
-
     with (
         caplog.at_level("ERROR"),
         patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
-            return_value=mock_client_session_cm,
+            return_value=mock_session,
         ),
     ):
         result = await governance_instance.load_rules_from_blockchain()
@@ -145,15 +137,11 @@ async def test_load_rules_from_blockchain_exception(governance_instance, caplog)
     mock_session = Mock()
     mock_session.post.return_value = mock_session_post_cm
 
-    mock_client_session_cm = AsyncMock()
-    mock_client_session_cm.__aenter__.return_value = mock_session
-    mock_client_session_cm.__aexit__.return_value = None
-
     with (
         caplog.at_level("ERROR"),
         patch(
             "inputs.plugins.ethereum_governance.aiohttp.ClientSession",
-            return_value=mock_client_session_cm,
+            return_value=mock_session,
         ),
     ):
         result = await governance_instance.load_rules_from_blockchain()
@@ -214,7 +202,7 @@ def test_initialization_sets_defaults(governance_instance, mock_io_provider):
     )
     assert governance_instance.universal_rule is None
     assert hasattr(governance_instance, "messages")
-    assert isinstance(governance_instance.messages, list)
+    assert isinstance(governance_instance.messages, deque)
 
 
 @pytest.mark.asyncio
@@ -281,7 +269,8 @@ async def test_raw_to_text_adds_unique_message_to_buffer(governance_instance):
 async def test_raw_to_text_does_not_add_duplicate_message(governance_instance):
     test_rule_str = "Duplicate Governance Rule"
     existing_msg = Message(timestamp=1233.0, message=test_rule_str)
-    governance_instance.messages = [existing_msg]
+    governance_instance.messages = deque([existing_msg], maxlen=1024)
+    governance_instance._last_message = test_rule_str
 
     initial_len = len(governance_instance.messages)
 
@@ -301,7 +290,8 @@ def test_formatted_latest_buffer_formats_latest_message(
     governance_instance, mock_io_provider
 ):
     msg = Message(timestamp=1234.0, message="formatted buffered message")
-    governance_instance.messages = [msg]
+    governance_instance.messages = deque([msg], maxlen=1024)
+    governance_instance._last_message = msg.message
 
     result = governance_instance.formatted_latest_buffer()
 
@@ -312,3 +302,49 @@ def test_formatted_latest_buffer_formats_latest_message(
     mock_io_provider.add_input.assert_called_once_with(
         "Universal Laws", "formatted buffered message", 1234.0
     )
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_history_is_bounded(governance_instance):
+    for i in range(1100):
+        await governance_instance.raw_to_text(f"rule {i}")
+
+    assert len(governance_instance.messages) == 1024
+    assert governance_instance.messages[-1].message == "rule 1099"
+    assert governance_instance._last_message == "rule 1099"
+
+
+@pytest.mark.asyncio
+async def test_close_closes_session(governance_instance):
+    session = Mock(closed=False, close=AsyncMock())
+    governance_instance._session = session
+
+    await governance_instance.close()
+
+    session.close.assert_awaited_once()
+    assert governance_instance._session is None
+
+
+@pytest.mark.asyncio
+async def test_cancelling_listener_closes_session(governance_instance):
+    session = Mock(closed=False, close=AsyncMock())
+    governance_instance._session = session
+    polling = asyncio.Event()
+
+    async def blocking_poll():
+        polling.set()
+        await asyncio.Event().wait()
+
+    async def consume():
+        async for _ in governance_instance.listen():
+            pass
+
+    with patch.object(governance_instance, "_poll", side_effect=blocking_poll):
+        task = asyncio.create_task(consume())
+        await asyncio.wait_for(polling.wait(), timeout=1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    session.close.assert_awaited_once()
+    assert governance_instance._session is None
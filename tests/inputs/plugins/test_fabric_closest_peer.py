@@ -1,7 +1,8 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import aiohttp
 import pytest
-import requests
 
 from inputs.plugins.fabric_closest_peer import (
     FabricClosestPeer,
@@ -17,20 +18,39 @@ def mock_io_provider():
         yield mock_instance
 
 
+@pytest.fixture(autouse=True)
+def no_poll_delay():
+    # _poll waits 0.5s before every lookup; skip it so each test runs instantly
+    with patch("inputs.plugins.fabric_closest_peer.asyncio.sleep", new=AsyncMock()):
+        yield
+
+
 @pytest.fixture
 def fabric_closest_peer_instance(mock_io_provider):
     config = FabricClosestPeerConfig()
-    with (
-        patch("inputs.plugins.fabric_closest_peer.requests"),
-        patch(
-            "inputs.plugins.fabric_closest_peer.IOProvider",
-            return_value=mock_io_provider,
-        ),
+    with patch(
+        "inputs.plugins.fabric_closest_peer.IOProvider",
+        return_value=mock_io_provider,
     ):
         instance = FabricClosestPeer(config=config)
     return instance
 
 
+def create_session(json_data=None, post_side_effect=None):
+    response = MagicMock()
+    response.json = AsyncMock(return_value=json_data)
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+
+    session = Mock()
+    session.closed = False
+    session.close = AsyncMock()
+    session.post.return_value = response
+    if post_side_effect is not None:
+        session.post.side_effect = post_side_effect
+    return session
+
+
 def test_initialization_sets_defaults(fabric_closest_peer_instance, mock_io_provider):
     assert fabric_closest_peer_instance.io is not None
     assert mock_io_provider is not None
@@ -43,6 +63,7 @@ def test_initialization_sets_defaults(fabric_closest_peer_instance, mock_io_prov
 
     assert fabric_closest_peer_instance.fabric_endpoint == "http://localhost:8545"
     assert fabric_closest_peer_instance.mock_mode is True
+    assert fabric_closest_peer_instance._timeout == aiohttp.ClientTimeout(total=3.0)
 
 
 @pytest.mark.asyncio
@@ -71,12 +92,7 @@ async def test_poll_returns_mocked_peer_when_mock_mode_enabled(
 
 
 @pytest.mark.asyncio
-async def test_poll_returns_none_if_requests_is_none_and_mock_disabled(caplog):
-    pass
-
-
-@pytest.mark.asyncio
-async def test_poll_fetches_peer_via_requests_when_mock_disabled_success(
+async def test_poll_fetches_peer_via_aiohttp_when_mock_disabled_success(
     fabric_closest_peer_instance, mock_io_provider
 ):
     config = FabricClosestPeerConfig(mock_mode=False)
@@ -91,12 +107,13 @@ async def test_poll_fetches_peer_via_requests_when_mock_disabled_success(
     json_response_data = {
         "result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]
     }
-    mock_response = Mock()
-    mock_response.json.return_value = json_response_data
+    mock_session = create_session(json_response_data)
+    mock_post = mock_session.post
 
     with patch(
-        "inputs.plugins.fabric_closest_peer.requests.post", return_value=mock_response
-    ) as mock_post:
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
         result = await fabric_closest_peer_instance._poll()
 
         expected_result = "Closest peer at -33.86500, 151.21000"
@@ -119,11 +136,25 @@ async def test_poll_fetches_peer_via_requests_when_mock_disabled_success(
                 "id": 1,
                 "jsonrpc": "2.0",
             },
-            timeout=3.0,
+            timeout=aiohttp.ClientTimeout(total=3.0),
             headers={"Content-Type": "application/json"},
         )
 
 
+@pytest.mark.asyncio
+async def test_poll_formats_coordinates_once_for_queue_and_return(
+    fabric_closest_peer_instance,
+):
+    fabric_closest_peer_instance.config = FabricClosestPeerConfig(
+        mock_mode=True, mock_lat=40.123454, mock_lon=-74.987651
+    )
+
+    result = await fabric_closest_peer_instance._poll()
+
+    assert result == "Closest peer at 40.12345, -74.98765"
+    assert fabric_closest_peer_instance.msg_q.get_nowait() is result
+
+
 @pytest.mark.asyncio
 async def test_poll_returns_none_if_io_latitude_or_longitude_missing(
     caplog, fabric_closest_peer_instance, mock_io_provider
@@ -145,7 +176,7 @@ async def test_poll_returns_none_if_io_latitude_or_longitude_missing(
 
 
 @pytest.mark.asyncio
-async def test_poll_returns_none_on_requests_exception(
+async def test_poll_returns_none_on_client_error(
     caplog, fabric_closest_peer_instance, mock_io_provider
 ):
     config = FabricClosestPeerConfig(mock_mode=False)
@@ -157,9 +188,11 @@ async def test_poll_returns_none_on_requests_exception(
         "longitude": 151.209295,
     }.get(x)
 
+    mock_session = create_session(post_side_effect=aiohttp.ClientError("Network error"))
+
     with patch(
-        "inputs.plugins.fabric_closest_peer.requests.post",
-        side_effect=requests.exceptions.RequestException("Network error"),
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
     ):
         with caplog.at_level("ERROR"):
             result = await fabric_closest_peer_instance._poll()
@@ -185,11 +218,10 @@ async def test_poll_returns_none_if_no_peer_found(
     }.get(x)
 
     json_response_data_no_peer = {"result": []}
-    mock_response_no_peer = Mock()
-    mock_response_no_peer.json.return_value = json_response_data_no_peer
+    mock_session = create_session(json_response_data_no_peer)
     with patch(
-        "inputs.plugins.fabric_closest_peer.requests.post",
-        return_value=mock_response_no_peer,
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
     ):
         with caplog.at_level("INFO"):
             result = await fabric_closest_peer_instance._poll()
@@ -198,6 +230,176 @@ async def test_poll_returns_none_if_no_peer_found(
     assert "FabricClosestPeer: no peer found." in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_poll_reuses_session_across_polls(
+    fabric_closest_peer_instance, mock_io_provider
+):
+    fabric_closest_peer_instance.mock_mode = False
+    position = {"latitude": -33.868820, "longitude": 151.209295}
+    mock_io_provider.get_dynamic_variable.side_effect = position.get
+
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+    mock_client_session = Mock(return_value=mock_session)
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        mock_client_session,
+    ):
+        await fabric_closest_peer_instance._poll()
+        position["latitude"] = -33.869
+        await fabric_closest_peer_instance._poll()
+
+    assert mock_client_session.call_count == 1
+    assert mock_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_when_coords_unchanged(
+    fabric_closest_peer_instance, mock_io_provider
+):
+    fabric_closest_peer_instance.mock_mode = False
+    mock_io_provider.get_dynamic_variable.side_effect = lambda x: {
+        "latitude": -33.868820,
+        "longitude": 151.209295,
+    }.get(x)
+
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
+        first = await fabric_closest_peer_instance._poll()
+        second = await fabric_closest_peer_instance._poll()
+
+    assert first == second == "Closest peer at -33.86500, 151.21000"
+    assert mock_session.post.call_count == 1
+    assert fabric_closest_peer_instance.msg_q.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_refetches_after_moving(
+    fabric_closest_peer_instance, mock_io_provider
+):
+    fabric_closest_peer_instance.mock_mode = False
+    position = {"latitude": -33.868820, "longitude": 151.209295}
+    mock_io_provider.get_dynamic_variable.side_effect = position.get
+
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
+        await fabric_closest_peer_instance._poll()
+        position["latitude"] = -33.869
+        await fabric_closest_peer_instance._poll()
+
+    assert mock_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_refetches_after_refresh_interval(mock_io_provider):
+    with patch(
+        "inputs.plugins.fabric_closest_peer.IOProvider",
+        return_value=mock_io_provider,
+    ):
+        instance = FabricClosestPeer(
+            config=FabricClosestPeerConfig(mock_mode=False, peer_refresh_sec=0)
+        )
+    mock_io_provider.get_dynamic_variable.side_effect = lambda x: {
+        "latitude": -33.868820,
+        "longitude": 151.209295,
+    }.get(x)
+
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
+        await instance._poll()
+        await instance._poll()
+
+    assert mock_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_reuses_configured_timeout(mock_io_provider):
+    with patch(
+        "inputs.plugins.fabric_closest_peer.IOProvider",
+        return_value=mock_io_provider,
+    ):
+        instance = FabricClosestPeer(
+            config=FabricClosestPeerConfig(mock_mode=False, http_timeout=1.5)
+        )
+    position = {"latitude": -33.868820, "longitude": 151.209295}
+    mock_io_provider.get_dynamic_variable.side_effect = position.get
+
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
+        await instance._poll()
+        position["latitude"] = -33.869
+        await instance._poll()
+
+    timeouts = [c.kwargs["timeout"] for c in mock_session.post.call_args_list]
+    assert timeouts[0] is timeouts[1] is instance._timeout
+    assert instance._timeout.total == 1.5
+
+
+@pytest.mark.asyncio
+async def test_poll_does_not_block_event_loop(
+    fabric_closest_peer_instance, mock_io_provider
+):
+    fabric_closest_peer_instance.mock_mode = False
+    mock_io_provider.get_dynamic_variable.side_effect = lambda x: {
+        "latitude": -33.868820,
+        "longitude": 151.209295,
+    }.get(x)
+
+    # The response only arrives once another task has run, which can
+    # never happen if the request blocks the event loop.
+    other_task_ran = asyncio.Event()
+    mock_session = create_session(
+        {"result": [{"peer": {"latitude": -33.865, "longitude": 151.210}}]}
+    )
+    response = mock_session.post.return_value
+
+    async def slow_enter():
+        await other_task_ran.wait()
+        return response
+
+    response.__aenter__ = AsyncMock(side_effect=slow_enter)
+
+    async def other_task():
+        other_task_ran.set()
+
+    with patch(
+        "inputs.plugins.fabric_closest_peer.aiohttp.ClientSession",
+        return_value=mock_session,
+    ):
+        result, _ = await asyncio.wait_for(
+            asyncio.gather(fabric_closest_peer_instance._poll(), other_task()),
+            timeout=1.0,
+        )
+
+    assert result == "Closest peer at -33.86500, 151.21000"
+
+
 @pytest.mark.asyncio
 async def test_raw_to_text_adds_message_to_list(fabric_closest_peer_instance):
     test_message = "Closest peer at -33.86500, 151.21000"
@@ -237,3 +439,39 @@ def test_formatted_latest_buffer_formats_and_clears_latest_message(
     assert call_args[0][0] == "Closest Peer from Fabric"
     assert call_args[0][1] == msg
     assert fabric_closest_peer_instance.msg_q.empty()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_session(fabric_closest_peer_instance):
+    session = create_session()
+    fabric_closest_peer_instance._session = session
+
+    await fabric_closest_peer_instance.close()
+
+    session.close.assert_awaited_once()
+    assert fabric_closest_peer_instance._session is None
+
+
+@pytest.mark.asyncio
+async def test_cancelling_listener_closes_session(fabric_closest_peer_instance):
+    session = create_session()
+    fabric_closest_peer_instance._session = session
+    polling = asyncio.Event()
+
+    async def blocking_poll():
+        polling.set()
+        await asyncio.Event().wait()
+
+    async def consume():
+        async for _ in fabric_closest_peer_instance.listen():
+            pass
+
+    with patch.object(fabric_closest_peer_instance, "_poll", side_effect=blocking_poll):
+        task = asyncio.create_task(consume())
+        await asyncio.wait_for(polling.wait(), timeout=1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    session.close.assert_awaited_once()
+    assert fabric_closest_peer_instance._session is None
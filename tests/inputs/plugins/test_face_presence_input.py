@@ -1,13 +1,19 @@
 import time
 from collections import deque
-from queue import Queue
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from inputs.plugins.face_presence_input import FacePresence, FacePresenceConfig, Message
 
 
+@pytest.fixture(autouse=True)
+def no_poll_delay():
+    # _poll waits 0.5s before reading the buffer; skip it so tests run instantly
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.fixture
 def mock_io_provider():
     with patch("inputs.plugins.face_presence_input.IOProvider") as mock_class:
@@ -46,8 +52,8 @@ def test_initialization_creates_providers_and_buffers(mock_io_provider):
     assert instance.messages.maxlen == 300
 
     assert hasattr(instance, "message_buffer")
-    assert isinstance(instance.message_buffer, Queue)
-    assert instance.message_buffer.maxsize == 64
+    assert isinstance(instance.message_buffer, deque)
+    assert instance.message_buffer.maxlen == 64
 
     assert instance.descriptor_for_LLM == "Face Presence Sensor"
 
@@ -73,7 +79,7 @@ def face_presence_instance(mock_io_provider):
 @pytest.mark.asyncio
 async def test_poll_returns_message_from_buffer(face_presence_instance):
     test_message = "present=[alice], unknown=0, ts=123456"
-    face_presence_instance.message_buffer.put_nowait(test_message)
+    face_presence_instance.message_buffer.append(test_message)
 
     result = await face_presence_instance._poll()
 
@@ -88,42 +94,42 @@ async def test_poll_returns_none_if_buffer_empty(face_presence_instance):
 
 
 @pytest.mark.asyncio
-async def test_poll_has_delay(face_presence_instance):
-    with patch("asyncio.sleep") as mock_sleep:
-        await face_presence_instance._poll()
-        mock_sleep.assert_called_once_with(0.5)
+async def test_poll_has_delay(face_presence_instance, no_poll_delay):
+    await face_presence_instance._poll()
+
+    no_poll_delay.assert_awaited_once_with(0.5)
 
 
 def test_handle_face_message_adds_to_buffer_successfully(face_presence_instance):
     test_message = "present=[bob], unknown=1, ts=123457"
-    initial_size = face_presence_instance.message_buffer.qsize()
+    initial_size = len(face_presence_instance.message_buffer)
 
     face_presence_instance._handle_face_message(test_message)
 
-    final_size = face_presence_instance.message_buffer.qsize()
+    final_size = len(face_presence_instance.message_buffer)
     assert final_size == initial_size + 1
-    assert face_presence_instance.message_buffer.get_nowait() == test_message
+    assert face_presence_instance.message_buffer.popleft() == test_message
 
 
 def test_handle_face_message_drops_oldest_on_full_buffer(face_presence_instance):
     for i in range(64):
-        face_presence_instance.message_buffer.put_nowait(f"msg_{i}")
+        face_presence_instance.message_buffer.append(f"msg_{i}")
 
     face_presence_instance._handle_face_message("msg_NEW")
 
-    assert face_presence_instance.message_buffer.qsize() == 64
+    assert len(face_presence_instance.message_buffer) == 64
+    assert face_presence_instance.message_buffer[0] == "msg_1"
+    assert face_presence_instance.message_buffer[-1] == "msg_NEW"
+    assert "msg_0" not in face_presence_instance.message_buffer
 
-    first_popped = face_presence_instance.message_buffer.get_nowait()
-    assert first_popped == "msg_1"
 
-    remaining_items = []
-    for _ in range(62):
-        remaining_items.append(face_presence_instance.message_buffer.get_nowait())
+def test_buffer_auto_evicts_oldest(face_presence_instance):
+    face_presence_instance.message_buffer = deque(maxlen=2)
 
-    last_item = face_presence_instance.message_buffer.get_nowait()
-    assert last_item == "msg_NEW"
+    for message in ("first", "second", "third"):
+        face_presence_instance._handle_face_message(message)
 
-    assert "msg_0" not in remaining_items
+    assert list(face_presence_instance.message_buffer) == ["second", "third"]
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,6 @@
 import time
 from collections import deque
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -11,6 +11,13 @@ from inputs.plugins.gallery_identities_input import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_poll_delay():
+    # _poll waits 0.5s before reading the buffer; skip it so tests run instantly
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.fixture
 def mock_io_provider():
     with patch("inputs.plugins.gallery_identities_input.IOProvider") as mock_class:
@@ -19,64 +26,48 @@ def mock_io_provider():
         yield mock_instance
 
 
-def test_initialization_creates_providers_and_buffers(mock_io_provider):
-    config = GalleryIdentitiesConfig()
+@pytest.fixture
+def mock_gallery_provider():
     mock_provider_instance = Mock()
-
-    mock_provider_constructor = Mock(return_value=mock_provider_instance)
-
     with patch(
         "inputs.plugins.gallery_identities_input.GalleryIdentitiesProvider",
-        new=mock_provider_constructor,
-    ):
-        with patch(
-            "inputs.plugins.gallery_identities_input.IOProvider",
-            return_value=mock_io_provider,
-        ):
-            instance = GalleryIdentities(config=config)
-
-    mock_provider_constructor.assert_called_once()
+        return_value=mock_provider_instance,
+    ) as mock_constructor:
+        yield mock_constructor
+
+
+@pytest.fixture
+def gallery_identities_instance(mock_io_provider, mock_gallery_provider):
+    return GalleryIdentities(config=GalleryIdentitiesConfig())
+
+
+def test_initialization_creates_providers_and_buffers(
+    gallery_identities_instance, mock_gallery_provider, mock_io_provider
+):
+    instance = gallery_identities_instance
+    mock_provider_instance = mock_gallery_provider.return_value
+
+    mock_gallery_provider.assert_called_once()
     mock_provider_instance.start.assert_called_once()
     mock_provider_instance.register_message_callback.assert_called_once()
 
-    assert instance.io_provider is not None
-    assert mock_io_provider is not None
+    assert instance.io_provider is mock_io_provider
 
     assert hasattr(instance, "messages")
     assert isinstance(instance.messages, deque)
     assert instance.messages.maxlen == 300
 
     assert hasattr(instance, "message_buffer")
-    from queue import Queue
-
-    assert isinstance(instance.message_buffer, Queue)
-    assert instance.message_buffer.maxsize == 64
+    assert isinstance(instance.message_buffer, deque)
+    assert instance.message_buffer.maxlen == 64
 
     assert instance.descriptor_for_LLM == "Gallery Identities"
 
 
-@pytest.fixture
-def gallery_identities_instance(mock_io_provider):
-    config = GalleryIdentitiesConfig()
-    mock_provider_instance = Mock()
-    with (
-        patch(
-            "inputs.plugins.gallery_identities_input.IOProvider",
-            return_value=mock_io_provider,
-        ),
-        patch(
-            "inputs.plugins.gallery_identities_input.GalleryIdentitiesProvider",
-            return_value=mock_provider_instance,
-        ),
-    ):
-        instance = GalleryIdentities(config=config)
-    return instance
-
-
 @pytest.mark.asyncio
 async def test_poll_returns_message_from_buffer(gallery_identities_instance):
     test_message = "total=2 ids=[alice, bob]"
-    gallery_identities_instance.message_buffer.put_nowait(test_message)
+    gallery_identities_instance.message_buffer.append(test_message)
 
     result = await gallery_identities_instance._poll()
 
@@ -91,46 +82,47 @@ async def test_poll_returns_none_if_buffer_empty(gallery_identities_instance):
 
 
 @pytest.mark.asyncio
-async def test_poll_has_delay(gallery_identities_instance):
-    with patch("asyncio.sleep") as mock_sleep:
-        await gallery_identities_instance._poll()
-        mock_sleep.assert_called_once_with(0.5)
+async def test_poll_has_delay(gallery_identities_instance, no_poll_delay):
+    await gallery_identities_instance._poll()
+
+    no_poll_delay.assert_awaited_once_with(0.5)
 
 
 def test_handle_gallery_message_adds_to_buffer_successfully(
     gallery_identities_instance,
 ):
     test_message = "total=1 ids=[charlie]"
-    initial_size = gallery_identities_instance.message_buffer.qsize()
+    initial_size = len(gallery_identities_instance.message_buffer)
 
     gallery_identities_instance._handle_gallery_message(test_message)
 
-    final_size = gallery_identities_instance.message_buffer.qsize()
+    final_size = len(gallery_identities_instance.message_buffer)
     assert final_size == initial_size + 1
-    assert gallery_identities_instance.message_buffer.get_nowait() == test_message
+    assert gallery_identities_instance.message_buffer.popleft() == test_message
 
 
 def test_handle_gallery_message_drops_oldest_on_full_buffer(
     gallery_identities_instance,
 ):
     for i in range(64):
-        gallery_identities_instance.message_buffer.put_nowait(f"id_{i}")
+        gallery_identities_instance.message_buffer.append(f"id_{i}")
 
     gallery_identities_instance._handle_gallery_message("id_NEW")
 
-    assert gallery_identities_instance.message_buffer.qsize() == 64
+    assert len(gallery_identities_instance.message_buffer) == 64
+    assert gallery_identities_instance.message_buffer[0] == "id_1"
+    assert gallery_identities_instance.message_buffer[-1] == "id_NEW"
+    assert "id_0" not in gallery_identities_instance.message_buffer
 
-    first_popped = gallery_identities_instance.message_buffer.get_nowait()
-    assert first_popped == "id_1"
 
-    remaining_items = []
-    for _ in range(62):
-        remaining_items.append(gallery_identities_instance.message_buffer.get_nowait())
-
-    last_item = gallery_identities_instance.message_buffer.get_nowait()
-    assert last_item == "id_NEW"
+@pytest.mark.asyncio
+async def test_poll_drains_buffer_in_fifo_order(gallery_identities_instance):
+    for message in ("first", "second"):
+        gallery_identities_instance._handle_gallery_message(message)
 
-    assert "id_0" not in remaining_items
+    assert await gallery_identities_instance._poll() == "first"
+    assert await gallery_identities_instance._poll() == "second"
+    assert await gallery_identities_instance._poll() is None
 
 
 @pytest.mark.asyncio
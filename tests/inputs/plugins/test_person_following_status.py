@@ -0,0 +1,723 @@
+import asyncio
+from collections import deque
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+import pytest
+from pydantic import AnyHttpUrl, ValidationError
+from yarl import URL
+
+from inputs.base import Message
+from inputs.plugins.person_following_status import (
+    PersonFollowingStatus,
+    PersonFollowingStatusConfig,
+    TrackingStatus,
+    TrackState,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_poll_delay():
+    with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def mock_io_provider():
+    with patch("inputs.plugins.person_following_status.IOProvider") as mock_class:
+        mock_instance = Mock()
+        mock_class.return_value = mock_instance
+        yield mock_instance
+
+
+class FrozenClock:
+    """Stand-in for time.monotonic that only moves when advanced."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    clock = FrozenClock()
+    monkeypatch.setattr("inputs.plugins.person_following_status.time.monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def status_instance(mock_io_provider):
+    return PersonFollowingStatus(config=PersonFollowingStatusConfig())
+
+
+class FakeResponse:
+    """Minimal aiohttp response usable as an async context manager."""
+
+    def __init__(self, status=200, json_data=None):
+        self.status = status
+        self._json = json_data if json_data is not None else {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def json(self):
+        return self._json
+
+
+def create_session(get_response=None, post_response=None, get_side_effect=None):
+    session = Mock()
+    session.closed = False
+    session.close = AsyncMock()
+    session.get.return_value = get_response or FakeResponse()
+    session.post.return_value = post_response or FakeResponse()
+    if get_side_effect is not None:
+        session.get.side_effect = get_side_effect
+    return session
+
+
+def test_init_urls(status_instance):
+    assert status_instance.status_url == URL("http://localhost:8080/status")
+    assert status_instance.enroll_url == URL("http://localhost:8080/enroll")
+    assert status_instance.poll_interval == 0.5
+    assert status_instance.enroll_retry_interval == 3.0
+    assert isinstance(status_instance.messages, deque)
+    assert status_instance._session is None
+
+
+@pytest.mark.parametrize(
+    "attr,value",
+    [
+        ("poll_interval", 0.0),
+        ("poll_interval", 0.001),
+        ("poll_interval", 3600.0),
+        ("enroll_retry_interval", 0.0),
+        ("enroll_retry_interval", 60.0),
+    ],
+)
+def test_config_intervals(mock_io_provider, attr, value):
+    status = PersonFollowingStatus(config=PersonFollowingStatusConfig(**{attr: value}))
+
+    assert getattr(status, attr) == value
+
+
+def test_config_default_base_url_is_validated():
+    config = PersonFollowingStatusConfig()
+
+    assert isinstance(config.person_follow_base_url, AnyHttpUrl)
+    assert str(config.person_follow_base_url) == "http://localhost:8080/"
+
+
+@pytest.mark.parametrize(
+    "base_url", ["http://robot.local:9000", "http://robot.local:9000/"]
+)
+def test_config_base_url(mock_io_provider, base_url):
+    status = PersonFollowingStatus(
+        config=PersonFollowingStatusConfig(person_follow_base_url=base_url)
+    )
+
+    assert str(status.status_url) == "http://robot.local:9000/status"
+    assert str(status.enroll_url) == "http://robot.local:9000/enroll"
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("poll_interval", -1.0),
+        ("enroll_retry_interval", -0.5),
+        ("person_follow_base_url", "not a url"),
+        ("person_follow_base_url", "ftp://robot.local"),
+    ],
+)
+def test_config_rejects_invalid_values(field, value):
+    with pytest.raises(ValidationError):
+        PersonFollowingStatusConfig(**{field: value})
+
+
+@pytest.mark.asyncio
+async def test_poll_reports_tracking_started(status_instance):
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": True, "x": 0.5, "z": 2.0, "status": "TRACKING_ACTIVE"}
+        )
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        result = await status_instance._poll()
+
+    assert result is not None
+    assert result.startswith("TRACKING STARTED")
+    assert "2.0m ahead" in result
+    assert status_instance._has_ever_tracked is True
+    session.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_status_non_200(status_instance):
+    session = create_session(get_response=FakeResponse(503))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        result = await status_instance._poll()
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_poll_client_error(status_instance):
+    session = create_session(get_side_effect=aiohttp.ClientError("refused"))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        result = await status_instance._poll()
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_zero_poll_interval_uses_sleep0(mock_io_provider, no_poll_delay):
+    status = PersonFollowingStatus(
+        config=PersonFollowingStatusConfig(poll_interval=0.0)
+    )
+    session = create_session(get_side_effect=aiohttp.ClientError("refused"))
+
+    with patch.object(status, "_get_session", return_value=session):
+        await status._poll()
+        await status._poll()
+
+    assert [c.args[0] for c in no_poll_delay.await_args_list] == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_poll_backs_off_after_failures(status_instance, no_poll_delay):
+    session = create_session(get_side_effect=aiohttp.ClientError("refused"))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+        await status_instance._poll()
+        await status_instance._poll()
+
+    delays = [c.args[0] for c in no_poll_delay.await_args_list]
+    assert delays == [0.5, 1.0, 2.0]
+    assert status_instance._consecutive_failures == 3
+
+
+@pytest.mark.asyncio
+async def test_poll_backoff_resets_on_success(status_instance, no_poll_delay):
+    status_instance._consecutive_failures = 4
+    session = create_session(get_response=FakeResponse(200, {"is_tracked": False}))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+        await status_instance._poll()
+
+    delays = [c.args[0] for c in no_poll_delay.await_args_list]
+    assert delays == [8.0, 0.5]
+    assert status_instance._consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_backoff_is_capped(status_instance, no_poll_delay):
+    status_instance._consecutive_failures = 20
+    session = create_session(get_response=FakeResponse(503))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+
+    no_poll_delay.assert_awaited_once_with(30.0)
+    assert status_instance._consecutive_failures == 21
+
+
+@pytest.mark.parametrize("interval,expected", [(0.5, 30.0), (0.0, 0.0), (60.0, 60.0)])
+def test_backoff_survives_long_outage(interval, expected):
+    assert PersonFollowingStatus._backoff(interval, 10_000) == expected
+
+
+@pytest.mark.asyncio
+async def test_poll_after_long_outage(status_instance, no_poll_delay):
+    status_instance._consecutive_failures = 10_000
+    session = create_session(get_response=FakeResponse(503))
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        result = await status_instance._poll()
+
+    assert result is None
+    no_poll_delay.assert_awaited_once_with(30.0)
+    assert status_instance._consecutive_failures == 10_001
+
+
+@pytest.mark.asyncio
+async def test_enroll_retry_after_long_outage(
+    status_instance, frozen_clock, no_poll_delay
+):
+    status_instance._enroll_failures = 10_000
+    status_instance._last_enroll_attempt = frozen_clock.now - 30.0
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "INACTIVE", "target_track_id": None}
+        ),
+        post_response=FakeResponse(500),
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+        await status_instance._enroll_task
+
+    session.post.assert_called_once()
+    assert status_instance._enroll_failures == 10_001
+
+
+@pytest.mark.asyncio
+async def test_enroll_retry_backs_off_after_failures(status_instance, frozen_clock):
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "INACTIVE", "target_track_id": None}
+        ),
+        post_response=FakeResponse(500),
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+        await status_instance._enroll_task
+        frozen_clock.advance(4.0)
+        await status_instance._poll()
+        frozen_clock.advance(2.5)
+        await status_instance._poll()
+        await status_instance._enroll_task
+
+    assert session.post.call_count == 2
+    assert status_instance._enroll_failures == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_inactive_triggers_enroll(status_instance):
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "INACTIVE", "target_track_id": None}
+        )
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+        await status_instance._enroll_task
+
+    session.post.assert_called_once()
+    assert session.post.call_args.args[0] == URL("http://localhost:8080/enroll")
+
+
+@pytest.mark.asyncio
+async def test_poll_does_not_wait_for_enroll(status_instance):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_enroll(session):
+        started.set()
+        await release.wait()
+
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "INACTIVE", "target_track_id": None}
+        )
+    )
+
+    with (
+        patch.object(status_instance, "_get_session", return_value=session),
+        patch.object(status_instance, "_try_enroll", side_effect=slow_enroll) as enroll,
+        patch("inputs.plugins.person_following_status.time.monotonic") as mock_time,
+    ):
+        mock_time.return_value = 100.0
+        await status_instance._poll()
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+
+        # Interval elapsed, but the first request is still in flight
+        mock_time.return_value = 200.0
+        await status_instance._poll()
+
+        assert enroll.call_count == 1
+        assert not status_instance._enroll_task.done()
+
+        release.set()
+        await status_instance._enroll_task
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_enroll(status_instance):
+    task = asyncio.create_task(asyncio.Event().wait())
+    status_instance._enroll_task = task
+
+    await status_instance.close()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert status_instance._enroll_task is None
+
+
+@pytest.mark.asyncio
+async def test_poll_searching_no_enroll(status_instance):
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "SEARCHING", "target_track_id": 7}
+        )
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+
+    session.post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_tracking_active_skips_enroll_check(status_instance):
+    session = create_session(
+        get_response=FakeResponse(
+            200,
+            {
+                "is_tracked": True,
+                "x": 0.0,
+                "z": 1.0,
+                "status": "TRACKING_ACTIVE",
+                "target_track_id": None,
+            },
+        )
+    )
+
+    with patch.object(status_instance, "_get_session", return_value=session):
+        await status_instance._poll()
+
+    session.post.assert_not_called()
+    assert status_instance._last_enroll_attempt is None
+    assert status_instance._enroll_task is None
+    assert status_instance._has_ever_tracked is True
+
+
+@pytest.mark.asyncio
+async def test_session_reused_across_polls(status_instance):
+    session = create_session(get_response=FakeResponse(200, {"is_tracked": False}))
+    mock_client_session = Mock(return_value=session)
+
+    with (
+        patch(
+            "inputs.plugins.person_following_status.aiohttp.ClientSession",
+            mock_client_session,
+        ),
+        patch("inputs.plugins.person_following_status.aiohttp.TCPConnector"),
+    ):
+        await status_instance._poll()
+        await status_instance._poll()
+
+    assert mock_client_session.call_count == 1
+    assert session.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_connector_config(status_instance):
+    session = status_instance._get_session()
+    try:
+        connector = session.connector
+        assert connector.limit == 2
+        assert connector.limit_per_host == 2
+        assert connector._keepalive_timeout == 75
+    finally:
+        await status_instance.close()
+
+
+@pytest.mark.asyncio
+async def test_config_uds_path(mock_io_provider):
+    status = PersonFollowingStatus(
+        config=PersonFollowingStatusConfig(uds_path="/tmp/person_follow.sock")
+    )
+
+    session = status._get_session()
+    try:
+        assert isinstance(session.connector, aiohttp.UnixConnector)
+        assert session.connector.path == "/tmp/person_follow.sock"
+        assert session.connector.limit == 2
+    finally:
+        await status.close()
+
+
+@pytest.mark.asyncio
+async def test_close_closes_session(status_instance):
+    session = create_session()
+    status_instance._session = session
+
+    await status_instance.close()
+
+    session.close.assert_awaited_once()
+    assert status_instance._session is None
+
+
+@pytest.mark.asyncio
+async def test_cancelling_listener_closes_session(status_instance):
+    session = create_session()
+    status_instance._session = session
+    polling = asyncio.Event()
+
+    async def blocking_poll():
+        polling.set()
+        await asyncio.Event().wait()
+
+    async def consume():
+        async for _ in status_instance.listen():
+            pass
+
+    with patch.object(status_instance, "_poll", side_effect=blocking_poll):
+        task = asyncio.create_task(consume())
+        await asyncio.wait_for(polling.wait(), timeout=1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    session.close.assert_awaited_once()
+    assert status_instance._session is None
+
+
+def test_format_tracking_lost_is_not_announced_immediately(status_instance):
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+
+    result = status_instance._format_status(
+        TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1)
+    )
+
+    assert result is None
+    assert status_instance._state == TrackState.JUST_LOST
+
+
+def test_format_searching_after_delay(status_instance, frozen_clock):
+    searching = TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1)
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+    status_instance._format_status(searching)
+
+    frozen_clock.advance(1.5)
+    assert status_instance._format_status(searching) is None
+
+    frozen_clock.advance(1.5)
+    result = status_instance._format_status(searching)
+
+    assert result is not None
+    assert result.startswith("SEARCHING")
+
+
+def test_format_waiting_after_person_leaves(status_instance, frozen_clock):
+    inactive = TrackingStatus(is_tracked=False, status="INACTIVE")
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+    status_instance._format_status(inactive)
+
+    frozen_clock.advance(3.0)
+    result = status_instance._format_status(inactive)
+
+    assert result is not None
+    assert result.startswith("WAITING")
+
+
+def test_format_uses_given_monotonic_time(status_instance):
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE"), now=100.0
+    )
+    status_instance._format_status(
+        TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1),
+        now=101.0,
+    )
+
+    assert status_instance._state == TrackState.JUST_LOST
+    assert status_instance._state_since == 101.0
+    assert (
+        status_instance._format_status(
+            TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1),
+            now=102.5,
+        )
+        is None
+    )
+    assert status_instance._format_status(
+        TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1),
+        now=103.5,
+    ).startswith("SEARCHING")
+
+
+@pytest.mark.asyncio
+async def test_poll_first_enroll_not_gated_by_clock(status_instance):
+    session = create_session(
+        get_response=FakeResponse(
+            200, {"is_tracked": False, "status": "INACTIVE", "target_track_id": None}
+        )
+    )
+
+    with (
+        patch.object(status_instance, "_get_session", return_value=session),
+        patch(
+            "inputs.plugins.person_following_status.time.monotonic", return_value=1.0
+        ),
+    ):
+        await status_instance._poll()
+        await status_instance._enroll_task
+
+    session.post.assert_called_once()
+    assert status_instance._last_enroll_attempt == 1.0
+
+
+def test_tracking_status_from_dict():
+    status = TrackingStatus.from_dict(
+        {
+            "is_tracked": True,
+            "x": -0.3,
+            "z": 1.5,
+            "status": "TRACKING_ACTIVE",
+            "target_track_id": 4,
+            "extra": "ignored",
+        }
+    )
+
+    assert status == TrackingStatus(
+        is_tracked=True, status="TRACKING_ACTIVE", x=-0.3, z=1.5, target_track_id=4
+    )
+    assert TrackingStatus.from_dict({}) == TrackingStatus()
+
+
+def test_format_lost_announced_once_then_reacquired(status_instance):
+    tracked = TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    searching = TrackingStatus(is_tracked=False, status="SEARCHING", target_track_id=1)
+
+    assert status_instance._format_status(tracked, now=10.0).startswith(
+        "TRACKING STARTED"
+    )
+    assert status_instance._format_status(searching, now=11.0) is None
+    assert status_instance._format_status(searching, now=13.5).startswith("SEARCHING")
+    assert status_instance._state == TrackState.ANNOUNCED_LOST
+    assert status_instance._format_status(searching, now=20.0) is None
+
+    assert status_instance._format_status(tracked, now=21.0).startswith(
+        "TRACKING STARTED"
+    )
+    assert status_instance._state == TrackState.TRACKING
+
+
+def test_format_never_tracked_stays_idle(status_instance):
+    inactive = TrackingStatus(is_tracked=False, status="INACTIVE")
+
+    assert status_instance._format_status(inactive, now=0.0) is None
+    assert status_instance._format_status(inactive, now=60.0) is None
+    assert status_instance._state == TrackState.IDLE
+
+
+def test_format_currently_tracking(status_instance):
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+
+    result = status_instance._format_status(
+        TrackingStatus(is_tracked=True, x=-0.3, z=1.5, status="TRACKING_ACTIVE")
+    )
+
+    assert (
+        result == "TRACKING: Following person at 1.5m ahead, -0.3m to the side. "
+        "Status: TRACKING_ACTIVE"
+    )
+
+
+def test_format_tracking_reuses_text_for_same_rounded_distance(status_instance):
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+
+    first = status_instance._format_status(
+        TrackingStatus(is_tracked=True, x=0.31, z=1.52, status="TRACKING_ACTIVE")
+    )
+    second = status_instance._format_status(
+        TrackingStatus(is_tracked=True, x=0.34, z=1.48, status="TRACKING_ACTIVE")
+    )
+    moved = status_instance._format_status(
+        TrackingStatus(is_tracked=True, x=0.3, z=1.7, status="TRACKING_ACTIVE")
+    )
+
+    assert second is first
+    assert moved == (
+        "TRACKING: Following person at 1.7m ahead, 0.3m to the side. "
+        "Status: TRACKING_ACTIVE"
+    )
+
+
+def test_format_tracking_normalizes_negative_zero(status_instance):
+    status_instance._format_status(
+        TrackingStatus(is_tracked=True, status="TRACKING_ACTIVE")
+    )
+
+    result = status_instance._format_status(
+        TrackingStatus(is_tracked=True, x=-0.01, z=1.0, status="TRACKING_ACTIVE")
+    )
+
+    assert "0.0m to the side" in result
+    assert "-0.0" not in result
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_appends_message(status_instance):
+    with patch("time.time", return_value=1234.0):
+        await status_instance.raw_to_text("TRACKING: Following person")
+
+    assert len(status_instance.messages) == 1
+    assert status_instance.messages[-1].timestamp == 1234.0
+
+
+def test_messages_deque_is_bounded(status_instance):
+    maxlen = status_instance.messages.maxlen
+    assert maxlen == 50
+
+    status_instance.messages.extend(
+        Message(timestamp=float(i), message=f"Message {i}") for i in range(maxlen + 3)
+    )
+
+    assert len(status_instance.messages) == maxlen
+    assert status_instance.messages[0].message == "Message 3"
+    assert status_instance.messages[-1].message == f"Message {maxlen + 2}"
+
+
+def test_formatted_buffer_empty(status_instance):
+    assert status_instance.formatted_latest_buffer() is None
+
+
+def test_formatted_buffer_with_message(status_instance, mock_io_provider):
+    status_instance.messages.append(
+        Message(timestamp=1234.0, message="TRACKING: Following person")
+    )
+
+    result = status_instance.formatted_latest_buffer()
+
+    assert result == (
+        "\nINPUT: Person Following Status\n// START\n"
+        "TRACKING: Following person\n// END\n"
+    )
+    assert len(status_instance.messages) == 0
+    mock_io_provider.add_input.assert_called_once_with(
+        "PersonFollowingStatus", "TRACKING: Following person", 1234.0
+    )
+
+
+def test_formatted_buffer_single_add_input_for_queued_messages(
+    status_instance, mock_io_provider
+):
+    status_instance.messages.append(
+        Message(timestamp=1.0, message="TRACKING STARTED: Person detected")
+    )
+    status_instance.messages.append(
+        Message(timestamp=2.0, message="TRACKING: Following person")
+    )
+
+    result = status_instance.formatted_latest_buffer()
+
+    assert "TRACKING: Following person" in result
+    assert "TRACKING STARTED" not in result
+    assert len(status_instance.messages) == 0
+    mock_io_provider.add_input.assert_called_once_with(
+        "PersonFollowingStatus", "TRACKING: Following person", 2.0
+    )
@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+import serial
+
+from inputs.base import Message, SensorConfig
+from inputs.plugins.serial_reader import SerialReader
+
+
+@pytest.fixture(autouse=True)
+def mock_serial(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr("inputs.plugins.serial_reader.serial.Serial", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_io_provider():
+    with patch("inputs.plugins.serial_reader.IOProvider") as mock_class:
+        mock_instance = Mock()
+        mock_class.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def reader(mock_io_provider):
+    return SerialReader(SensorConfig())
+
+
+def test_init_opens_serial_port(reader, mock_serial):
+    mock_serial.assert_called_once_with("/dev/cu.usbmodem1101", 9600, timeout=1)
+    assert reader.ser is mock_serial.return_value
+    assert reader.messages == []
+    assert reader.descriptor_for_LLM == "Heart Rate and Grip Strength"
+
+
+def test_init_serial_error(mock_io_provider, mock_serial):
+    mock_serial.side_effect = serial.SerialException("port not found")
+
+    reader = SerialReader(SensorConfig())
+
+    assert reader.ser is None
+
+
+@pytest.mark.asyncio
+async def test_poll_returns_line(reader, mock_serial):
+    mock_serial.return_value.readline.return_value = b"Pulse: Elevated\r\n"
+
+    with patch("inputs.plugins.serial_reader.asyncio.sleep", new=AsyncMock()):
+        result = await reader._poll()
+
+    assert result == "Pulse: Elevated"
+
+
+@pytest.mark.asyncio
+async def test_poll_empty_line(reader, mock_serial):
+    mock_serial.return_value.readline.return_value = b"\r\n"
+
+    with patch("inputs.plugins.serial_reader.asyncio.sleep", new=AsyncMock()):
+        result = await reader._poll()
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_poll_without_connection(reader):
+    reader.ser = None
+
+    with patch("inputs.plugins.serial_reader.asyncio.sleep", new=AsyncMock()):
+        result = await reader._poll()
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_none(reader):
+    assert await reader._raw_to_text(None) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("Pulse: Elevated", "The child's pulse rate is Elevated."),
+        ("Grip: Normal", "The child's grip strength is Normal."),
+        ("Pulse:  Normal", "The child's pulse rate is Normal."),
+        ("Pulse:", "The child's pulse rate reading is missing."),
+        ("Pulse:   ", "The child's pulse rate reading is missing."),
+        ("Grip:", "The child's grip strength reading is missing."),
+        ("Unknown: Data", "No serial data."),
+    ],
+)
+async def test_raw_to_text_variants(reader, raw, expected):
+    result = await reader._raw_to_text(raw)
+
+    assert result is not None
+    assert result.message == expected
+
+
+def test_formatted_latest_buffer(reader, mock_io_provider):
+    reader.messages.append(
+        Message(timestamp=1234.0, message="The child's pulse rate is Normal.")
+    )
+
+    result = reader.formatted_latest_buffer()
+
+    assert "INPUT: Heart Rate and Grip Strength" in result
+    assert "The child's pulse rate is Normal." in result
+    assert reader.messages == []
+    mock_io_provider.add_input.assert_called_once_with(
+        "SerialReader", "The child's pulse rate is Normal.", 1234.0
+    )
+
+
+def test_formatted_latest_buffer_empty(reader):
+    assert reader.formatted_latest_buffer() is None
@@ -0,0 +1,118 @@
+import gc
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+# YOLO is always patched below; stub ultralytics so collecting this file
+# does not import it (and torch) just to resolve the name
+sys.modules["ultralytics"] = MagicMock()
+
+from inputs.plugins.vlm_local_yolo import (  # noqa: E402
+    VLM_Local_YOLO,
+    VLM_Local_YOLOConfig,
+    check_webcam,
+)
+
+# Shared read-only frame, allocated once rather than per test
+_DUMMY_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+_DUMMY_FRAME.flags.writeable = False
+
+
+@pytest.fixture(scope="module")
+def module_mocks():
+    with (
+        patch("inputs.plugins.vlm_local_yolo.YOLO") as mock_yolo,
+        patch("inputs.plugins.vlm_local_yolo.IOProvider") as mock_io_provider,
+        patch("inputs.plugins.vlm_local_yolo.OdomProvider") as mock_odom_provider,
+        patch("inputs.plugins.vlm_local_yolo.check_webcam") as mock_check_webcam,
+        patch("inputs.plugins.vlm_local_yolo.cv2.VideoCapture") as mock_capture,
+    ):
+        yield {
+            "yolo": mock_yolo,
+            "io_provider": mock_io_provider,
+            "odom_provider": mock_odom_provider,
+            "check_webcam": mock_check_webcam,
+            "capture": mock_capture,
+        }
+
+
+@pytest.fixture
+def mock_dependencies(module_mocks):
+    for mock in module_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    module_mocks["check_webcam"].return_value = (640, 480)
+    return module_mocks
+
+
+def test_init_opens_camera(mock_dependencies):
+    vlm = VLM_Local_YOLO(VLM_Local_YOLOConfig(camera_index=2))
+
+    mock_dependencies["capture"].assert_called_once_with(2)
+    assert vlm.have_cam is True
+    assert vlm.cap is mock_dependencies["capture"].return_value
+    assert vlm.cam_third == 213
+
+
+def test_init_without_camera(mock_dependencies):
+    mock_dependencies["check_webcam"].return_value = (0, 0)
+
+    vlm = VLM_Local_YOLO(VLM_Local_YOLOConfig())
+
+    mock_dependencies["capture"].assert_not_called()
+    assert vlm.cap is None
+    assert vlm._release_cap is None
+
+
+def test_camera_released_when_collected(mock_dependencies):
+    cap = mock_dependencies["capture"].return_value
+    vlm = VLM_Local_YOLO(VLM_Local_YOLOConfig())
+    assert vlm._release_cap is not None
+    assert vlm._release_cap.alive is True
+
+    del vlm
+    gc.collect()
+
+    cap.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_poll_returns_detections(mock_dependencies):
+    cap = mock_dependencies["capture"].return_value
+    cap.read.return_value = (True, _DUMMY_FRAME)
+    model = mock_dependencies["yolo"].return_value
+    model.names = {0: "person"}
+    box = MagicMock()
+    box.xyxy = [[10.2, 20.6, 110.0, 220.4]]
+    box.cls = [0]
+    box.conf = [0.87654]
+    model.predict.return_value = [MagicMock(boxes=[box])]
+    mock_dependencies["odom_provider"].return_value.position = None
+
+    vlm = VLM_Local_YOLO(VLM_Local_YOLOConfig())
+    with patch("inputs.plugins.vlm_local_yolo.asyncio.sleep", new=AsyncMock()):
+        detections = await vlm._poll()
+
+    assert model.predict.call_args.kwargs["source"] is _DUMMY_FRAME
+    assert detections == [
+        {"class": "person", "confidence": 0.8765, "bbox": [10, 21, 110, 220]}
+    ]
+
+
+@pytest.mark.parametrize("opened", [True, False])
+def test_check_webcam_releases_probe(opened):
+    probe = MagicMock()
+    probe.isOpened.return_value = opened
+
+    with (
+        patch("inputs.plugins.vlm_local_yolo.cv2.VideoCapture", return_value=probe),
+        patch(
+            "inputs.plugins.vlm_local_yolo.set_best_resolution",
+            return_value=(1280, 720),
+        ),
+    ):
+        result = check_webcam(0)
+
+    assert result == ((1280, 720) if opened else (0, 0))
+    probe.release.assert_called_once()
@@ -7,71 +7,62 @@ from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from inputs.orchestrator import InputOrchestrator
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class MockInput(FuserInput[SensorConfig, str]):
-    def __init__(self):
-        super().__init__(SensorConfig())
-        self.poll_count = 0
-        self.max_polls = 3
 
-    async def _listen_loop(self):
-        while self.poll_count < self.max_polls:
-            await asyncio.sleep(0.1)
-            self.poll_count += 1
-            yield str(self.poll_count)
+def make_input(values=("1", "2", "3"), error=None):
+    """
+    Build a FuserInput that yields ``values``, then raises ``error`` if given.
 
-    async def raw_to_text(self, raw_input):
-        pass
+    Returns the sensor together with the AsyncMock installed as its raw_to_text.
+    """
 
-    def formatted_latest_buffer(self):
-        return None
+    async def listen_loop():
+        for value in values:
+            await asyncio.sleep(0)
+            yield value
+        if error is not None:
+            raise error
 
+    raw_to_text = AsyncMock()
+    sensor = FuserInput(SensorConfig())
+    sensor._listen_loop = listen_loop
+    sensor.raw_to_text = raw_to_text
+    return sensor, raw_to_text
 
-class ErrorInput(MockInput):
-    async def _listen_loop(self):
-        while True:
-            await asyncio.sleep(0.1)
-            yield "error"
-            raise ValueError("Test error")
 
-
-@pytest.mark.asyncio
 async def test_input_orchestrator_initialization():
     """Test that the InputOrchestrator initializes with a list of inputs."""
-    inputs = [MockInput(), MockInput()]
+    inputs = [make_input()[0], make_input()[0]]
     orchestrator = InputOrchestrator(inputs)
     assert orchestrator.inputs == inputs
 
 
-@pytest.mark.asyncio
 async def test_listen_to_input():
     """Test that the InputOrchestrator listens to a single input."""
-    mock_input = MockInput()
-    mock_input.raw_to_text = AsyncMock()
+    mock_input, raw_to_text = make_input()
     orchestrator = InputOrchestrator([mock_input])
-    await asyncio.wait_for(orchestrator._listen_to_input(mock_input), timeout=5.0)
-    assert mock_input.raw_to_text.call_count == 3
+    await asyncio.wait_for(orchestrator._listen_to_input(mock_input), timeout=1.0)
+    assert raw_to_text.call_count == 3
 
 
-@pytest.mark.asyncio
 async def test_listen_multiple_inputs():
     """Test that the InputOrchestrator listens to multiple inputs concurrently."""
-    inputs = [MockInput(), MockInput()]
-    for input in inputs:
-        input.raw_to_text = AsyncMock()
-    orchestrator = InputOrchestrator(inputs)
-    await asyncio.wait_for(orchestrator.listen(), timeout=5.0)
-    for input in inputs:
-        assert input.raw_to_text.call_count == 3  # type: ignore
+    built = [make_input(), make_input()]
+    orchestrator = InputOrchestrator([sensor for sensor, _ in built])
+    await asyncio.wait_for(orchestrator.listen(), timeout=1.0)
+    for _, raw_to_text in built:
+        assert raw_to_text.call_count == 3
 
 
-@pytest.mark.asyncio
 async def test_input_exception_handling():
     """Test that when one input fails, other inputs continue operating."""
-    error_input = ErrorInput()
-    normal_input = MockInput()
-    normal_input.raw_to_text = AsyncMock()
+    error_input, error_raw_to_text = make_input(
+        values=("error",), error=ValueError("Test error")
+    )
+    normal_input, normal_raw_to_text = make_input()
     orchestrator = InputOrchestrator([error_input, normal_input])
 
-    await asyncio.wait_for(orchestrator.listen(), timeout=5.0)
-    assert normal_input.raw_to_text.call_count == 3
+    await asyncio.wait_for(orchestrator.listen(), timeout=1.0)
+    assert error_raw_to_text.call_count == 1
+    assert normal_raw_to_text.call_count == 3